@@ -171,6 +171,20 @@ class PluginManager:
             logger.error(f"Error loading plugin: {str(e)}")
             return False
 
+    async def load_plugins(self, plugin_classes: List[type]) -> List[bool]:
+        """
+        Load and initialize several plugins concurrently
+        
+        Args:
+            plugin_classes: The plugin classes to load
+            
+        Returns:
+            list: Load result for each plugin class, in the given order
+        """
+        return list(await asyncio.gather(
+            *(self.load_plugin(plugin_class) for plugin_class in plugin_classes)
+        ))
+
     async def unload_plugin(self, plugin_name: str) -> bool:
         """
         Unload a plugin
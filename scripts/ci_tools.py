@@ -37,6 +37,10 @@ DIST_DIR = PROJECT_ROOT / "dist"
 REPORTS_DIR = PROJECT_ROOT / "reports" / "ci"
 DOCKER_DIR = PROJECT_ROOT / "docker"
 
+# Marker expressions for splitting the suite into per-commit and nightly runs
+FAST_TEST_MARKERS = "not slow and not ui"
+SLOW_TEST_MARKERS = "slow or ui"
+
 class CITools:
     """CI/CD utility class."""
     
@@ -170,11 +174,13 @@ class CITools:
             logger.error(f"Error building Docker image: {e}")
             return False
     
-    def run_tests(self, coverage: bool = True) -> bool:
-        """Run test suite."""
+    def run_tests(self, coverage: bool = True, markers: Optional[str] = None) -> bool:
+        """Run test suite, optionally restricted to a marker expression."""
         try:
             # Prepare test command
             cmd = ["pytest", "-v"]
+            if markers:
+                cmd.extend(["-m", markers])
             if coverage:
                 cmd.extend([
                     "--cov=.",
@@ -497,6 +503,26 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip coverage analysis"
     )
+    test_selection = test_parser.add_mutually_exclusive_group()
+    test_selection.add_argument(
+        "--fast",
+        dest="markers",
+        action="store_const",
+        const=FAST_TEST_MARKERS,
+        help=f"Run only the fast tests ({FAST_TEST_MARKERS}), e.g. for pull requests"
+    )
+    test_selection.add_argument(
+        "--slow",
+        dest="markers",
+        action="store_const",
+        const=SLOW_TEST_MARKERS,
+        help=f"Run only the slow and UI tests ({SLOW_TEST_MARKERS}), e.g. nightly"
+    )
+    test_selection.add_argument(
+        "-m", "--markers",
+        dest="markers",
+        help="Only run tests matching the given marker expression"
+    )
     
     # Quality command
     quality_parser = subparsers.add_parser(
@@ -555,7 +581,7 @@ def main():
             sys.exit(0 if build_results else 1)
         
         elif args.command == "test":
-            test_results = tools.run_tests(not args.no_coverage)
+            test_results = tools.run_tests(not args.no_coverage, args.markers)
             report_file = tools.generate_report(test_results=test_results)
             logger.info(f"Report generated: {report_file}")
             
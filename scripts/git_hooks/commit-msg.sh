@@ -0,0 +1,28 @@
+#!/bin/bash
+set -e
+
+# Validate the message in a single Python process instead of cat + grep + test
+exec python3 - "$1" <<'EOF'
+import re
+import sys
+
+# Pattern for conventional commits
+conventional_pattern = re.compile(
+    r"^(feat|fix|docs|style|refactor|test|chore|perf|ci|build|revert)(\([a-z]+\))?: .+"
+)
+
+with open(sys.argv[1]) as f:
+    commit_msg = f.read()
+
+if not conventional_pattern.match(commit_msg):
+    print("Error: Commit message does not follow conventional commits format.")
+    print("Format: <type>(<scope>): <description>")
+    print("Types: feat, fix, docs, style, refactor, test, chore, perf, ci, build, revert")
+    print("Example: feat(ui): add new settings dialog")
+    sys.exit(1)
+
+# Check subject length
+if len(commit_msg.splitlines()[0]) > 72:
+    print("Error: Commit message is too long (max 72 characters)")
+    sys.exit(1)
+EOF
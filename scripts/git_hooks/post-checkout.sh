@@ -0,0 +1,26 @@
+#!/bin/bash
+set -e
+
+# Call the project venv's Python directly, falling back to PATH
+venv_python="$JARVIS_VENV_PYTHON"
+[ -x "$venv_python" ] || venv_python=python3
+
+# List the changed files once for both checks
+changed=$(git diff --name-only "$1" "$2")
+
+# Reinstall only when requirements.txt content differs from the last install
+if [ -f "requirements.txt" ] && echo "$changed" | grep -q '^requirements\.txt$'; then
+    req_hash=$(git hash-object requirements.txt)
+    req_hash_file="$(git rev-parse --git-dir)/requirements.hash"
+    if [ "$req_hash" != "$(cat "$req_hash_file" 2>/dev/null)" ]; then
+        echo "Dependencies have changed. Running pip install..."
+        "$venv_python" -m pip install -r requirements.txt
+        echo "$req_hash" > "$req_hash_file"
+    fi
+fi
+
+# Rebuild documentation if docs have changed
+if echo "$changed" | grep -q "^docs/"; then
+    echo "Documentation has changed. Rebuilding..."
+    "$venv_python" scripts/build_docs.py
+fi
@@ -0,0 +1,60 @@
+#!/bin/bash
+set -e
+
+echo "Running pre-commit checks..."
+
+# Only staged Python files (added, copied or modified) are checked
+staged=$(git diff --cached --name-only --diff-filter=ACM -- '*.py')
+
+# Check for debug statements
+echo "Checking for debug statements..."
+debug_files=$([ -z "$staged" ] || grep -lE 'import pdb|breakpoint\(\)' -- $staged || true)
+if [ -n "$debug_files" ]; then
+    echo "Error: Found pdb imports or breakpoint() calls in:"
+    echo "$debug_files"
+    exit 1
+fi
+
+# Run code formatting, linting and type checking in parallel
+if [ -n "$staged" ]; then
+    echo "Running code formatting, linters and type checking..."
+    log_dir=$(mktemp -d)
+    trap 'rm -rf "$log_dir"' EXIT
+    
+    black --check -- $staged > "$log_dir/black.log" 2>&1 & black_pid=$!
+    flake8 -- $staged > "$log_dir/flake8.log" 2>&1 & flake8_pid=$!
+    pylint -- $staged > "$log_dir/pylint.log" 2>&1 & pylint_pid=$!
+    mypy --follow-imports=silent -- $staged > "$log_dir/mypy.log" 2>&1 & mypy_pid=$!
+    
+    failed=0
+    for tool in black flake8 pylint mypy; do
+        pid_var="${tool}_pid"
+        if ! wait "${!pid_var}"; then
+            echo "Error: $tool failed:"
+            cat "$log_dir/$tool.log"
+            failed=1
+        fi
+    done
+    [ "$failed" -eq 0 ] || exit 1
+fi
+
+# Run tests
+echo "Running tests..."
+pytest tests/
+
+# Check for large files with one stat call and one awk pass
+echo "Checking for large files..."
+if stat -c '%s' /dev/null >/dev/null 2>&1; then
+    size_format=(-c '%s %n')  # GNU stat
+else
+    size_format=(-f '%z %N')  # BSD stat
+fi
+git diff --cached --name-only -z --diff-filter=ACM \
+    | xargs -0 stat "${size_format[@]}" -- 2>/dev/null \
+    | awk '$1 > 5242880 {  # 5MB
+        print "Error: " substr($0, index($0, " ") + 1) " is too large (" $1 " bytes)"
+        failed = 1
+    }
+    END { exit failed + 0 }'
+
+echo "All pre-commit checks passed!"
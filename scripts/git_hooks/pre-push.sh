@@ -0,0 +1,18 @@
+#!/bin/bash
+set -e
+
+echo "Running pre-push checks..."
+
+# Run full test suite
+echo "Running full test suite..."
+pytest tests/ --cov=. --cov-report=term-missing
+
+# Check documentation build
+echo "Checking documentation build..."
+python scripts/build_docs.py --check
+
+# Run security checks
+echo "Running security checks..."
+bandit -r .
+
+echo "All pre-push checks passed!"
@@ -9,11 +9,12 @@ import sys
 import argparse
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 import logging
 import re
 from datetime import datetime
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +26,23 @@ logger = logging.getLogger(__name__)
 # Constants
 PROJECT_ROOT = Path(__file__).parent.parent
 PLUGINS_DIR = PROJECT_ROOT / "plugins"
+PLUGIN_INDEX_FILE = ".plugins_index.json"
+META_RE = re.compile(
+    r'self\.name\s*=\s*"(?P<name>[^"]*)".*?'
+    r'self\.description\s*=\s*"(?P<description>[^"]*)".*?'
+    r'self\.version\s*=\s*"(?P<version>[^"]*)"',
+    re.DOTALL
+)
+PLUGIN_HEAD_SIZE = 4096  # Metadata sits near the top of template plugins
+VALIDATION_TOKENS = (
+    "self.name", "self.description", "self.version",
+    "async def initialize", "async def process_command",
+    "register_command", "handle_error"
+)
+META_ATTR_RES = {
+    attr: re.compile(rf'self\.{attr}\s*=\s*"([^"]*)"')
+    for attr in ("name", "description", "version")
+}
 PLUGIN_TEMPLATE = """\"\"\"
 {plugin_name} plugin for Jarvis AI Assistant.
 Created: {creation_date}
@@ -140,6 +158,8 @@ class PluginTools:
         """Initialize plugin tools."""
         self.plugins_dir = PLUGINS_DIR
         self.plugins_dir.mkdir(exist_ok=True)
+        self.index_file = self.plugins_dir / PLUGIN_INDEX_FILE
+        self._index = self._load_index()
     
     def create_plugin(self, args: argparse.Namespace) -> bool:
         """Create a new plugin."""
@@ -193,26 +213,102 @@ class PluginTools:
     
     def list_plugins(self) -> List[Dict]:
         """List all available plugins."""
-        plugins = []
-        for plugin_file in self.plugins_dir.glob("*.py"):
-            if plugin_file.name != "__init__.py":
-                try:
-                    content = plugin_file.read_text()
-                    # Extract metadata using regex
-                    name_match = re.search(r'self\.name = "(.*?)"', content)
-                    desc_match = re.search(r'self\.description = "(.*?)"', content)
-                    ver_match = re.search(r'self\.version = "(.*?)"', content)
-                    
-                    plugins.append({
-                        "file": plugin_file.name,
-                        "name": name_match.group(1) if name_match else "Unknown",
-                        "description": desc_match.group(1) if desc_match else "No description",
-                        "version": ver_match.group(1) if ver_match else "0.0.0"
-                    })
-                except Exception as e:
-                    logger.warning(f"Error reading plugin {plugin_file}: {e}")
+        plugin_files = [
+            plugin_file for plugin_file in self.plugins_dir.glob("*.py")
+            if plugin_file.name != "__init__.py"
+        ]
+        
+        # Reuse cached metadata for files whose mtime and size are unchanged
+        index = {}
+        stale = []
+        for plugin_file in plugin_files:
+            stat = plugin_file.stat()
+            key = [stat.st_mtime_ns, stat.st_size]
+            cached = self._index.get(plugin_file.name)
+            if cached and cached["stat"] == key:
+                index[plugin_file.name] = cached
+            else:
+                stale.append((plugin_file, key))
+        
+        # Overlap file reads; extraction below stays sequential
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contents = list(executor.map(self._read_plugin, [f for f, _ in stale]))
+        
+        for (plugin_file, key), content in zip(stale, contents):
+            if content is not None:
+                index[plugin_file.name] = {
+                    "stat": key,
+                    "info": self._extract_metadata(plugin_file, content)
+                }
+        
+        if index != self._index:
+            self._index = index
+            self._save_index()
+        
+        return [
+            index[plugin_file.name]["info"]
+            for plugin_file in plugin_files
+            if plugin_file.name in index
+        ]
+    
+    def _extract_metadata(self, plugin_file: Path, content: str) -> Dict:
+        """Extract plugin metadata from source."""
+        info = {
+            "file": plugin_file.name,
+            "name": "Unknown",
+            "description": "No description",
+            "version": "0.0.0"
+        }
+        
+        # Template-generated plugins declare all three in order
+        match = META_RE.search(content)
+        if match:
+            info.update(match.groupdict())
+            return info
+        
+        for attr, pattern in META_ATTR_RES.items():
+            attr_match = pattern.search(content)
+            if attr_match:
+                info[attr] = attr_match.group(1)
         
-        return plugins
+        return info
+    
+    def _load_index(self) -> Dict:
+        """Load the cached plugin metadata index."""
+        try:
+            return json.loads(self.index_file.read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_index(self) -> None:
+        """Persist the plugin metadata index."""
+        try:
+            self.index_file.write_text(json.dumps(self._index, indent=2))
+        except OSError as e:
+            logger.warning(f"Error saving plugin index: {e}")
+    
+    def _read_plugin(self, plugin_file: Path) -> Optional[str]:
+        """Read a plugin file, returning None if it cannot be read."""
+        try:
+            return self._read_source(
+                plugin_file,
+                lambda text: META_RE.search(text) is not None
+            )
+        except Exception as e:
+            logger.warning(f"Error reading plugin {plugin_file}: {e}")
+            return None
+    
+    def _read_source(self, plugin_file: Path, complete: Callable[[str], bool]) -> str:
+        """Read a plugin's head, falling back to the full file if not complete."""
+        with open(plugin_file, "rb") as f:
+            head = f.read(PLUGIN_HEAD_SIZE)
+            if len(head) < PLUGIN_HEAD_SIZE:
+                return head.decode("utf-8")
+            
+            text = head.decode("utf-8", "ignore")
+            if complete(text):
+                return text
+            return (head + f.read()).decode("utf-8")
     
     def validate_plugin(self, plugin_file: Path) -> Dict:
         """Validate a plugin file."""
@@ -223,7 +319,10 @@ class PluginTools:
         }
         
         try:
-            content = plugin_file.read_text()
+            content = self._read_source(
+                plugin_file,
+                lambda text: all(token in text for token in VALIDATION_TOKENS)
+            )
             
             # Check for required attributes
             required_attrs = ["name", "description", "version"]
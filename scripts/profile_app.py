@@ -14,16 +14,10 @@ import tracemalloc
 import time
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Sequence
 import logging
 import json
-from datetime import datetime
 import psutil
-from memory_profiler import profile as memory_profile
-import yappi
-from guppy3 import hpy
-import matplotlib.pyplot as plt
-import numpy as np
 
 # Configure logging
 logging.basicConfig(
@@ -40,44 +34,67 @@ REPORTS_DIR = PROJECT_ROOT / "reports" / "performance"
 class PerformanceProfiler:
     """Performance profiling utility class."""
     
-    def __init__(self):
+    def __init__(self, trace_memory: bool = True):
         """Initialize profiler."""
         self.profile_dir = PROFILE_DIR
         self.reports_dir = REPORTS_DIR
         self.profile_dir.mkdir(exist_ok=True)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.process = psutil.Process()
+        self._charts = {}
+        
+        # Trace allocations from the start so analyze_memory has data
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
     
     async def profile_function(self, func: Callable, *args, **kwargs) -> Dict:
         """Profile a function's execution."""
         results = {}
+        is_coroutine = asyncio.iscoroutinefunction(func)
+        profile_path = self.profile_dir / f"profile_{func.__name__}_{int(time.time())}.stats"
         
-        # CPU profiling
-        profiler = cProfile.Profile()
-        profiler.enable()
+        # CPU profiling (yappi attributes time to coroutines, not the event loop)
+        if is_coroutine:
+            import yappi
+            yappi.set_clock_type("wall")
+            yappi.start(builtins=False)
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
         
         # Memory tracking
-        tracemalloc.start()
+        was_tracing = tracemalloc.is_tracing()
+        if was_tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
         start_mem = tracemalloc.get_traced_memory()
         
         # Time tracking
         start_time = time.perf_counter()
         
         try:
-            if asyncio.iscoroutinefunction(func):
+            if is_coroutine:
                 result = await func(*args, **kwargs)
             else:
                 result = func(*args, **kwargs)
         finally:
             end_time = time.perf_counter()
             end_mem = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            profiler.disable()
+            if not was_tracing:
+                tracemalloc.stop()
+            if is_coroutine:
+                yappi.stop()
+            else:
+                profiler.disable()
         
         # Process results
-        stats = pstats.Stats(profiler)
-        profile_path = self.profile_dir / f"profile_{func.__name__}_{int(time.time())}.stats"
-        stats.dump_stats(str(profile_path))
+        if is_coroutine:
+            yappi.get_func_stats().save(str(profile_path), type="pstat")
+            yappi.clear_stats()
+        else:
+            stats = pstats.Stats(profiler)
+            stats.dump_stats(str(profile_path))
         
         results.update({
             "function": func.__name__,
@@ -93,63 +110,73 @@ class PerformanceProfiler:
     
     def monitor_system(self, duration: int = 60, interval: float = 1.0) -> Dict:
         """Monitor system performance."""
+        import numpy as np
+        
+        # One preallocated array per metric, indexed by tick
+        capacity = int(duration / interval) + 1
         metrics = {
-            "cpu": [],
-            "memory": [],
-            "disk_io": [],
-            "network_io": []
+            "cpu": np.zeros(capacity, dtype=np.float64),
+            "memory": np.zeros(capacity, dtype=np.float64),
+            "disk_read": np.zeros(capacity, dtype=np.int64),
+            "disk_write": np.zeros(capacity, dtype=np.int64),
+            "net_recv": np.zeros(capacity, dtype=np.int64),
+            "net_sent": np.zeros(capacity, dtype=np.int64)
         }
+        ticks = 0
         
+        # Baseline samples; every tick then covers one full interval since
+        # the previous one (the first cpu_percent call only primes it)
         start_time = time.time()
         last_disk_io = psutil.disk_io_counters()
         last_net_io = psutil.net_io_counters()
+        psutil.cpu_percent(interval=None)
         
         try:
-            while time.time() - start_time < duration:
-                # CPU usage
-                metrics["cpu"].append(psutil.cpu_percent(interval=None))
+            while ticks < capacity and time.time() - start_time < duration:
+                time.sleep(interval)
+                
+                # CPU usage since the previous sample
+                metrics["cpu"][ticks] = psutil.cpu_percent(interval=None)
                 
                 # Memory usage
-                mem = psutil.virtual_memory()
-                metrics["memory"].append(mem.percent)
+                metrics["memory"][ticks] = psutil.virtual_memory().percent
                 
                 # Disk I/O
                 disk_io = psutil.disk_io_counters()
-                metrics["disk_io"].append({
-                    "read": disk_io.read_bytes - last_disk_io.read_bytes,
-                    "write": disk_io.write_bytes - last_disk_io.write_bytes
-                })
+                metrics["disk_read"][ticks] = disk_io.read_bytes - last_disk_io.read_bytes
+                metrics["disk_write"][ticks] = disk_io.write_bytes - last_disk_io.write_bytes
                 last_disk_io = disk_io
                 
                 # Network I/O
                 net_io = psutil.net_io_counters()
-                metrics["network_io"].append({
-                    "sent": net_io.bytes_sent - last_net_io.bytes_sent,
-                    "recv": net_io.bytes_recv - last_net_io.bytes_recv
-                })
+                metrics["net_recv"][ticks] = net_io.bytes_recv - last_net_io.bytes_recv
+                metrics["net_sent"][ticks] = net_io.bytes_sent - last_net_io.bytes_sent
                 last_net_io = net_io
                 
-                time.sleep(interval)
+                ticks += 1
         
         except KeyboardInterrupt:
             pass
         
-        return metrics
+        return {name: values[:ticks] for name, values in metrics.items()}
     
     def analyze_memory(self) -> Dict:
-        """Analyze memory usage using guppy."""
-        h = hpy()
-        heap = h.heap()
+        """Analyze memory usage using tracemalloc."""
+        if not tracemalloc.is_tracing():
+            logger.warning("Memory tracing is disabled; no allocations to analyze")
+            return {"total_size": 0.0, "by_location": []}
+        
+        stats = tracemalloc.take_snapshot().statistics("lineno")
         
         analysis = {
-            "total_size": heap.size / 1024 / 1024,  # MB
-            "by_type": [
+            "total_size": sum(stat.size for stat in stats) / 1024 / 1024,  # MB
+            "by_location": [
                 {
-                    "type": str(item.name),
-                    "count": item.count,
-                    "size": item.size / 1024  # KB
+                    "location": str(stat.traceback),
+                    "count": stat.count,
+                    "size": stat.size / 1024  # KB
                 }
-                for item in heap.byrcs
+                for stat in stats[:50]
             ]
         }
         
@@ -157,7 +184,7 @@ class PerformanceProfiler:
     
     def generate_report(self, data: Dict, report_type: str) -> Path:
         """Generate performance report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         report_file = self.reports_dir / f"{report_type}_report_{timestamp}.html"
         
         # Create report content
@@ -176,7 +203,7 @@ class PerformanceProfiler:
             "</head>",
             "<body>",
             f"<h1>Performance Report - {report_type}</h1>",
-            f"<p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>"
+            f"<p>Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}</p>"
         ]
         
         if report_type == "profile":
@@ -208,65 +235,67 @@ class PerformanceProfiler:
             # Add memory analysis results
             content.extend([
                 "<h2>Memory Analysis</h2>",
+                f"<p>Total Traced: {data['total_size']:.2f} MB</p>",
                 "<table>",
-                "<tr><th>Type</th><th>Count</th><th>Size (KB)</th></tr>"
+                "<tr><th>Location</th><th>Count</th><th>Size (KB)</th></tr>",
+                "\n".join(
+                    f"<tr><td>{item['location']}</td><td>{item['count']}</td><td>{item['size']:.2f}</td></tr>"
+                    for item in sorted(data["by_location"], key=lambda x: x["size"], reverse=True)
+                ),
+                "</table>"
             ])
-            
-            for item in sorted(data["by_type"], key=lambda x: x["size"], reverse=True)[:20]:
-                content.append(
-                    f"<tr><td>{item['type']}</td><td>{item['count']}</td><td>{item['size']:.2f}</td></tr>"
-                )
-            
-            content.append("</table>")
         
         content.extend([
             "</body>",
             "</html>"
         ])
         
-        report_file.write_text("\n".join(content))
+        report_file.write_bytes("\n".join(content).encode("utf-8"))
         return report_file
     
     def _create_performance_charts(self, data: Dict) -> None:
         """Create performance charts using matplotlib."""
-        # CPU Usage
-        plt.figure(figsize=(10, 6))
-        plt.plot(data["cpu"])
-        plt.title("CPU Usage")
-        plt.xlabel("Time (seconds)")
-        plt.ylabel("Usage (%)")
-        plt.grid(True)
-        plt.savefig(self.reports_dir / "cpu_usage.png")
-        plt.close()
-        
-        # Memory Usage
-        plt.figure(figsize=(10, 6))
-        plt.plot(data["memory"])
-        plt.title("Memory Usage")
-        plt.xlabel("Time (seconds)")
-        plt.ylabel("Usage (%)")
-        plt.grid(True)
-        plt.savefig(self.reports_dir / "memory_usage.png")
-        plt.close()
-        
-        # I/O Usage
-        plt.figure(figsize=(10, 6))
-        disk_read = [x["read"] for x in data["disk_io"]]
-        disk_write = [x["write"] for x in data["disk_io"]]
-        net_recv = [x["recv"] for x in data["network_io"]]
-        net_sent = [x["sent"] for x in data["network_io"]]
+        self._plot_series("cpu_usage", "CPU Usage", "Usage (%)", {"CPU": data["cpu"]})
+        self._plot_series("memory_usage", "Memory Usage", "Usage (%)", {"Memory": data["memory"]})
+        self._plot_series("io_usage", "I/O Usage", "Bytes", {
+            "Disk Read": data["disk_read"],
+            "Disk Write": data["disk_write"],
+            "Network Recv": data["net_recv"],
+            "Network Sent": data["net_sent"]
+        })
+    
+    def _plot_series(
+        self,
+        name: str,
+        title: str,
+        ylabel: str,
+        series: Dict[str, Sequence[float]]
+    ) -> None:
+        """Plot series on a cached figure, reusing its line artists."""
+        if name not in self._charts:
+            # Charts are only saved to disk, so bypass pyplot and GUI backends
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            
+            fig = Figure(figsize=(10, 6))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+            lines = {label: ax.plot([], [], label=label)[0] for label in series}
+            ax.set_title(title)
+            ax.set_xlabel("Time (seconds)")
+            ax.set_ylabel(ylabel)
+            ax.grid(True)
+            if len(series) > 1:
+                ax.legend()
+            self._charts[name] = (fig, ax, lines)
         
-        plt.plot(disk_read, label="Disk Read")
-        plt.plot(disk_write, label="Disk Write")
-        plt.plot(net_recv, label="Network Recv")
-        plt.plot(net_sent, label="Network Sent")
-        plt.title("I/O Usage")
-        plt.xlabel("Time (seconds)")
-        plt.ylabel("Bytes")
-        plt.legend()
-        plt.grid(True)
-        plt.savefig(self.reports_dir / "io_usage.png")
-        plt.close()
+        fig, ax, lines = self._charts[name]
+        for label, values in series.items():
+            lines[label].set_data(range(len(values)), values)
+        ax.relim()
+        ax.autoscale_view()
+        with open(self.reports_dir / f"{name}.png", "wb") as f:
+            fig.canvas.print_png(f)
 
 async def profile_app():
     """Profile the main application."""
@@ -11,17 +11,12 @@ import argparse
 from pathlib import Path
 import logging
 import json
-import yaml
-from typing import Dict, List, Optional, Set, Union, Tuple
+import html
+from typing import Dict, Iterator, List, Optional, Set, Union, Tuple
 import subprocess
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import semver
-import git
-from github import Github
-import toml
-from jinja2 import Template
-from tqdm import tqdm
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +30,66 @@ PROJECT_ROOT = Path(__file__).parent.parent
 CHANGELOG_FILE = PROJECT_ROOT / "CHANGELOG.md"
 VERSION_FILE = PROJECT_ROOT / "VERSION"
 REPORTS_DIR = PROJECT_ROOT / "reports" / "releases"
+WALK_SKIP_DIRS = {
+    ".git", ".venv", "venv", "node_modules", "build", "dist", "__pycache__", ".tox"
+}
+
+# Static head of the release report
+REPORT_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<title>Release Report</title>
+<style>
+body { font-family: Arial, sans-serif; margin: 20px; }
+.section { margin: 20px 0; padding: 20px; border: 1px solid #ddd; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+th { background-color: #f2f2f2; }
+.success { color: #4caf50; }
+.warning { color: #ff9800; }
+.error { color: #f44336; }
+</style>
+</head>
+<body>
+<h1>Release Report</h1>
+"""
+
+# Version patterns
+SETUP_VERSION_RE = re.compile(r'version="[^"]*"')
+INIT_VERSION_RE = re.compile(r'__version__\s*=\s*["\'][^"\']*["\']')
+POETRY_VERSION_RE = re.compile(r'(?ms)(^\[tool\.poetry\][^\[]*?^version\s*=\s*)"[^"]*"')
+
+# owner/name from HTTPS (https://host/owner/name.git) or SSH (git@host:owner/name.git) remotes
+REMOTE_URL_RE = re.compile(r'[:/]([^/:]+)/([^/]+?)(?:\.git)?/?$')
+
+# Conventional commit classification
+CONVENTIONAL_COMMIT_RE = re.compile(
+    r'^(feat|fix|chore|refactor|docs|style|perf|test|build|ci)(?:\([^)]*\))?!?:\s*(.*)$'
+)
+COMMIT_CATEGORIES = {
+    "feat": "Added",
+    "fix": "Fixed",
+    "chore": "Changed",
+    "refactor": "Changed",
+    "docs": "Changed",
+    "style": "Changed",
+    "perf": "Changed"
+}
+SKIPPED_COMMIT_TYPES = {"test", "build", "ci"}
+# Keywords guessing the category of other commits, checked in priority order
+FALLBACK_CATEGORIES = (
+    ("deprecat", "Deprecated"),
+    ("remove", "Removed"),
+    ("security", "Security")
+)
+
+def _fallback_category(message: str) -> str:
+    """Guess the changelog category of a non-conventional commit message."""
+    lower_msg = message.lower()
+    for keyword, category in FALLBACK_CATEGORIES:
+        if keyword in lower_msg:
+            return category
+    return "Changed"
 
 class ReleaseManager:
     """Release management utility class."""
@@ -44,23 +99,30 @@ class ReleaseManager:
         self.reports_dir = REPORTS_DIR
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize git repository
-        self.repo = git.Repo(PROJECT_ROOT)
+        # Load GitHub token if available (client is created on release)
+        self.github_token = os.getenv("GITHUB_TOKEN")
         
-        # Load GitHub token if available
-        self.github = None
-        if gh_token := os.getenv("GITHUB_TOKEN"):
-            self.github = Github(gh_token)
+        # Current version, read from VERSION_FILE on first use
+        self._version: Optional[str] = None
+        
+        # Release date taken once per run, so the changelog and release agree
+        self.release_date = datetime.now().strftime("%Y-%m-%d")
     
     def get_current_version(self) -> str:
         """Get current version from VERSION file."""
+        if self._version is not None:
+            return self._version
+        
         try:
             if VERSION_FILE.exists():
-                return VERSION_FILE.read_text().strip()
-            return "0.1.0"
+                self._version = VERSION_FILE.read_text().strip()
+            else:
+                self._version = "0.1.0"
         except Exception as e:
             logger.error(f"Error reading version: {e}")
             return "0.1.0"
+        
+        return self._version
     
     def bump_version(
         self,
@@ -71,6 +133,8 @@ class ReleaseManager:
         current = self.get_current_version()
         
         try:
+            import semver
+            
             if specific_version:
                 new = specific_version
                 # Validate version format
@@ -86,6 +150,7 @@ class ReleaseManager:
             
             # Update VERSION file
             VERSION_FILE.write_text(new)
+            self._version = new
             
             return current, new
             
@@ -110,26 +175,22 @@ class ReleaseManager:
             current_content = CHANGELOG_FILE.read_text()
             
             # Prepare new entry
-            new_entry = [
-                f"\n## [{version}] - {datetime.now().strftime('%Y-%m-%d')}\n"
-            ]
-            
-            for category, items in changes.items():
-                if items:
-                    new_entry.extend([
-                        f"\n### {category}\n"
-                    ])
-                    for item in items:
-                        new_entry.append(f"- {item}\n")
-            
-            # Insert after header
-            header_end = current_content.find("\n\n") + 2
-            updated_content = (
-                current_content[:header_end] +
-                "".join(new_entry) +
-                current_content[header_end:]
+            new_entry = f"\n## [{version}] - {self.release_date}\n" + "".join(
+                f"\n### {category}\n" + "".join(f"- {item}\n" for item in items)
+                for category, items in changes.items()
+                if items
             )
             
+            # Insert after header, or append when the file has no header block
+            header_end = current_content.find("\n\n")
+            if header_end == -1:
+                updated_content = current_content.rstrip("\n") + "\n\n" + new_entry
+            else:
+                header_end += 2
+                updated_content = (
+                    current_content[:header_end] + new_entry + current_content[header_end:]
+                )
+            
             CHANGELOG_FILE.write_text(updated_content)
             return True
             
@@ -150,72 +211,37 @@ class ReleaseManager:
         
         try:
             # Get commit range
-            if since_tag:
-                commit_range = f"{since_tag}..HEAD"
-            else:
-                tags = sorted(self.repo.tags, key=lambda t: t.commit.committed_date)
-                if tags:
-                    commit_range = f"{tags[-1]}..HEAD"
-                else:
-                    commit_range = "HEAD"
-            
-            # Get commits
-            commits = list(self.repo.iter_commits(commit_range))
-            
-            # Process commits
-            for commit in commits:
-                message = commit.message.strip()
-                
-                # Skip merge commits
-                if message.startswith("Merge"):
+            if not since_tag:
+                since_tag = self._get_last_tag()
+            commit_range = f"{since_tag}..HEAD" if since_tag else "HEAD"
+            
+            # Get commit subjects in one git call (merge commits are skipped).
+            # Never ask for file names here: --name-only/--stat make git log
+            # diff every commit and run several times slower.
+            messages = self._run_git(
+                "log", "--no-merges", "--no-patch", "--no-notes", "--no-decorate",
+                "--pretty=format:%s", commit_range
+            ).splitlines()
+            
+            # Process commits (cherry-picks and rebases can repeat a message)
+            seen = set()
+            for message in messages:
+                message = message.strip()
+                if message in seen:
                     continue
+                seen.add(message)
                 
                 # Categorize based on conventional commits
-                if message.startswith("feat"):
-                    changes["Added"].append(
-                        message.split(":", 1)[1].strip()
-                    )
-                elif message.startswith("fix"):
-                    changes["Fixed"].append(
-                        message.split(":", 1)[1].strip()
-                    )
-                elif message.startswith("chore"):
-                    changes["Changed"].append(
-                        message.split(":", 1)[1].strip()
-                    )
-                elif message.startswith("refactor"):
-                    changes["Changed"].append(
-                        message.split(":", 1)[1].strip()
-                    )
-                elif message.startswith("docs"):
-                    changes["Changed"].append(
-                        message.split(":", 1)[1].strip()
-                    )
-                elif message.startswith("style"):
-                    changes["Changed"].append(
-                        message.split(":", 1)[1].strip()
-                    )
-                elif message.startswith("perf"):
-                    changes["Changed"].append(
-                        message.split(":", 1)[1].strip()
-                    )
-                elif message.startswith("test"):
-                    continue  # Skip test commits
-                elif message.startswith("build"):
-                    continue  # Skip build commits
-                elif message.startswith("ci"):
-                    continue  # Skip CI commits
-                else:
-                    # Try to guess category from message
-                    lower_msg = message.lower()
-                    if "deprecat" in lower_msg:
-                        changes["Deprecated"].append(message)
-                    elif "remove" in lower_msg:
-                        changes["Removed"].append(message)
-                    elif "security" in lower_msg:
-                        changes["Security"].append(message)
-                    else:
-                        changes["Changed"].append(message)
+                match = CONVENTIONAL_COMMIT_RE.match(message)
+                if match:
+                    commit_type, description = match.groups()
+                    if commit_type in SKIPPED_COMMIT_TYPES:
+                        continue  # Skip test, build and CI commits
+                    changes[COMMIT_CATEGORIES[commit_type]].append(description)
+                    continue
+                
+                # Try to guess category from message
+                changes[_fallback_category(message)].append(message)
             
             return changes
             
@@ -223,6 +249,23 @@ class ReleaseManager:
             logger.error(f"Error collecting changes: {e}")
             return changes
     
+    def _run_git(self, *args: str) -> str:
+        """Run a git command in the project root and return its output."""
+        result = subprocess.run(
+            ["git", "-C", str(PROJECT_ROOT), *args],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        return result.stdout
+    
+    def _get_last_tag(self) -> Optional[str]:
+        """Get the most recent tag reachable from HEAD."""
+        try:
+            return self._run_git("describe", "--tags", "--abbrev=0").strip() or None
+        except subprocess.CalledProcessError:
+            return None  # No tags yet
+    
     def create_release(
         self,
         version: str,
@@ -231,27 +274,35 @@ class ReleaseManager:
     ) -> bool:
         """Create a new release."""
         try:
-            if not self.github:
+            if not self.github_token:
                 logger.error("GitHub token not available")
                 return False
             
+            try:
+                from github import Github
+            except ImportError:
+                logger.error("PyGithub is required to create releases")
+                return False
+            
             # Get repository
-            repo_name = self.repo.remotes.origin.url.split(".git")[0].split("/")[-2:]
-            repo = self.github.get_repo("/".join(repo_name))
+            remote_url = self._run_git("remote", "get-url", "origin").strip()
+            match = REMOTE_URL_RE.search(remote_url)
+            if not match:
+                logger.error(f"Cannot parse repository from remote URL: {remote_url}")
+                return False
+            owner, name = match.groups()
+            repo = Github(self.github_token).get_repo(f"{owner}/{name}")
             
             # Create release notes
             notes = [
                 f"# Release {version}\n",
-                f"Released on {datetime.now().strftime('%Y-%m-%d')}\n"
+                f"Released on {self.release_date}\n"
             ]
             
             for category, items in changes.items():
                 if items:
-                    notes.extend([
-                        f"\n## {category}\n"
-                    ])
-                    for item in items:
-                        notes.append(f"- {item}\n")
+                    notes.append(f"\n## {category}\n")
+                    notes.append("".join(f"- {item}\n" for item in dict.fromkeys(items)))
             
             # Create tag
             tag_name = f"v{version}"
@@ -282,35 +333,47 @@ class ReleaseManager:
             setup_file = PROJECT_ROOT / "setup.py"
             if setup_file.exists():
                 content = setup_file.read_text()
-                new_content = re.sub(
-                    r'version="[^"]*"',
-                    f'version="{version}"',
-                    content
-                )
+                new_content = SETUP_VERSION_RE.sub(f'version="{version}"', content)
                 setup_file.write_text(new_content)
                 files_updated.append(setup_file)
             
             # Update pyproject.toml
             pyproject_file = PROJECT_ROOT / "pyproject.toml"
             if pyproject_file.exists():
-                data = toml.load(pyproject_file)
-                if "tool" in data and "poetry" in data["tool"]:
-                    data["tool"]["poetry"]["version"] = version
-                    pyproject_file.write_text(toml.dumps(data))
+                content = pyproject_file.read_text()
+                
+                # Edit the version line in place rather than round-tripping the file
+                new_content, count = POETRY_VERSION_RE.subn(
+                    lambda match: f'{match.group(1)}"{version}"',
+                    content,
+                    count=1
+                )
+                if count:
+                    pyproject_file.write_text(new_content)
                     files_updated.append(pyproject_file)
+                else:
+                    try:
+                        import tomllib
+                    except ImportError:  # Python < 3.11
+                        import tomli as tomllib
+                    try:
+                        import tomli_w
+                    except ImportError:
+                        logger.error("tomli-w is required to rewrite pyproject.toml")
+                        return False
+                    
+                    data = tomllib.loads(content)
+                    if "tool" in data and "poetry" in data["tool"]:
+                        data["tool"]["poetry"]["version"] = version
+                        pyproject_file.write_text(tomli_w.dumps(data))
+                        files_updated.append(pyproject_file)
             
             # Update package __init__.py
-            init_files = list(PROJECT_ROOT.rglob("__init__.py"))
-            for init_file in init_files:
+            for init_file in self._find_version_init_files():
                 content = init_file.read_text()
-                if "__version__" in content:
-                    new_content = re.sub(
-                        r'__version__\s*=\s*["\'][^"\']*["\']',
-                        f'__version__ = "{version}"',
-                        content
-                    )
-                    init_file.write_text(new_content)
-                    files_updated.append(init_file)
+                new_content = INIT_VERSION_RE.sub(f'__version__ = "{version}"', content)
+                init_file.write_text(new_content)
+                files_updated.append(init_file)
             
             if files_updated:
                 logger.info(
@@ -324,8 +387,51 @@ class ReleaseManager:
             logger.error(f"Error updating version files: {e}")
             return False
     
-    def check_release_readiness(self) -> Dict:
-        """Check if project is ready for release."""
+    def _find_version_init_files(self) -> List[Path]:
+        """Find __init__.py files that define __version__."""
+        try:
+            # Only tracked files, so virtualenvs and build output are never walked
+            init_files = [
+                f for f in self._run_git(
+                    "ls-files", "-z", "--", "__init__.py", "*/__init__.py"
+                ).split("\0") if f
+            ]
+        except (subprocess.CalledProcessError, OSError):
+            return [
+                f for f in self._walk_init_files(PROJECT_ROOT)
+                if "__version__" in f.read_text()
+            ]
+        
+        if not init_files:
+            return []
+        
+        # Let grep read the candidates and report only those with __version__
+        result = subprocess.run(
+            ["grep", "-l", "-F", "__version__", "--", *init_files],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True
+        )
+        return [PROJECT_ROOT / f for f in result.stdout.splitlines()]
+    
+    def _walk_init_files(self, root: Path) -> Iterator[Path]:
+        """Walk the tree for __init__.py files, skipping environment and build dirs."""
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in WALK_SKIP_DIRS:
+                            stack.append(Path(entry.path))
+                    elif entry.name == "__init__.py":
+                        yield Path(entry.path)
+    
+    def check_release_readiness(self, fail_fast: bool = False) -> Dict:
+        """Check if project is ready for release.
+        
+        With fail_fast, stop at the first error instead of running the
+        remaining checks.
+        """
         results = {
             "ready": True,
             "checks": [],
@@ -335,62 +441,67 @@ class ReleaseManager:
         
         try:
             # Check for uncommitted changes
-            if self.repo.is_dirty():
+            if self._run_git("status", "--porcelain", "-z", "--untracked-files=no"):
                 results["errors"].append(
                     "There are uncommitted changes"
                 )
                 results["ready"] = False
-            
-            # Check tests
-            try:
-                subprocess.run(
-                    ["pytest"],
-                    check=True,
-                    capture_output=True
-                )
-                results["checks"].append("All tests passing")
-            except subprocess.CalledProcessError:
-                results["errors"].append("Tests are failing")
-                results["ready"] = False
-            
-            # Check code quality
-            try:
-                subprocess.run(
-                    ["flake8"],
-                    check=True,
-                    capture_output=True
-                )
-                results["checks"].append("Code quality checks passing")
-            except subprocess.CalledProcessError:
-                results["warnings"].append("Code quality issues found")
+                if fail_fast:
+                    return results
+            
+            # External tools are independent, so run them concurrently
+            tools = [
+                # (command, passed message, failure message, failure severity)
+                (["pytest", "--no-header", "-q", "-x"],
+                 "All tests passing", "Tests are failing", "errors"),
+                (["flake8"],
+                 "Code quality checks passing", "Code quality issues found", "warnings")
+            ]
             
             # Check documentation
             docs_dir = PROJECT_ROOT / "docs"
             if not docs_dir.exists():
                 results["warnings"].append("Documentation directory not found")
             else:
-                try:
-                    subprocess.run(
-                        ["sphinx-build", "-b", "html", "docs", "docs/_build"],
-                        check=True,
-                        capture_output=True
-                    )
-                    results["checks"].append("Documentation builds successfully")
-                except subprocess.CalledProcessError:
-                    results["warnings"].append("Documentation build failed")
+                tools.append((
+                    ["sphinx-build", "-b", "html", "docs", "docs/_build"],
+                    "Documentation builds successfully", "Documentation build failed", "warnings"
+                ))
             
             # Check dependencies
             requirements_file = PROJECT_ROOT / "requirements.txt"
             if requirements_file.exists():
-                try:
-                    subprocess.run(
-                        ["pip", "check"],
-                        check=True,
-                        capture_output=True
-                    )
-                    results["checks"].append("Dependencies are compatible")
-                except subprocess.CalledProcessError:
-                    results["warnings"].append("Dependency conflicts found")
+                tools.append((
+                    ["pip", "check"],
+                    "Dependencies are compatible", "Dependency conflicts found", "warnings"
+                ))
+            
+            # When failing fast, only start warning-level tools once the
+            # error-level ones have passed
+            if fail_fast:
+                phases = [
+                    [tool for tool in tools if tool[3] == "errors"],
+                    [tool for tool in tools if tool[3] != "errors"]
+                ]
+            else:
+                phases = [tools]
+            
+            for phase in phases:
+                with ThreadPoolExecutor(max_workers=len(phase)) as executor:
+                    futures = [
+                        executor.submit(subprocess.run, cmd, capture_output=True)
+                        for cmd, *_ in phase
+                    ]
+                    for future, (_, passed, failed, severity) in zip(futures, phase):
+                        if future.result().returncode == 0:
+                            results["checks"].append(passed)
+                        else:
+                            results[severity].append(failed)
+                            if severity == "errors":
+                                results["ready"] = False
+                
+                if fail_fast and not results["ready"]:
+                    return results
             
             # Check changelog
             if not CHANGELOG_FILE.exists():
@@ -415,87 +526,54 @@ class ReleaseManager:
         checks: Dict
     ) -> Path:
         """Generate release report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         report_file = self.reports_dir / f"release_report_{timestamp}.html"
         
-        content = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            "<title>Release Report</title>",
-            "<style>",
-            "body { font-family: Arial, sans-serif; margin: 20px; }",
-            ".section { margin: 20px 0; padding: 20px; border: 1px solid #ddd; }",
-            "table { border-collapse: collapse; width: 100%; }",
-            "th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }",
-            "th { background-color: #f2f2f2; }",
-            ".success { color: #4caf50; }",
-            ".warning { color: #ff9800; }",
-            ".error { color: #f44336; }",
-            "</style>",
-            "</head>",
-            "<body>",
-            "<h1>Release Report</h1>",
-            f"<p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>",
-            
-            "<div class='section'>",
-            "<h2>Release Information</h2>",
-            f"<p><strong>Version:</strong> {version}</p>",
-            "<h3>Changes</h3>"
-        ]
-        
-        for category, items in changes.items():
-            if items:
-                content.extend([
-                    f"<h4>{category}</h4>",
-                    "<ul>"
-                ])
-                for item in items:
-                    content.append(f"<li>{item}</li>")
-                content.append("</ul>")
-        
-        content.extend([
-            "</div>",
-            "<div class='section'>",
-            "<h2>Release Readiness</h2>",
-            f"<p><strong>Status:</strong> <span class='{'success' if checks['ready'] else 'error'}'>"
-            f"{'Ready' if checks['ready'] else 'Not Ready'}</span></p>"
-        ])
-        
-        if checks["checks"]:
-            content.extend([
-                "<h3>Passed Checks</h3>",
-                "<ul>"
-            ])
-            for check in checks["checks"]:
-                content.append(f"<li class='success'>{check}</li>")
-            content.append("</ul>")
-        
-        if checks["warnings"]:
-            content.extend([
-                "<h3>Warnings</h3>",
-                "<ul>"
-            ])
-            for warning in checks["warnings"]:
-                content.append(f"<li class='warning'>{warning}</li>")
-            content.append("</ul>")
-        
-        if checks["errors"]:
-            content.extend([
-                "<h3>Errors</h3>",
-                "<ul>"
-            ])
-            for error in checks["errors"]:
-                content.append(f"<li class='error'>{error}</li>")
-            content.append("</ul>")
-        
-        content.extend([
-            "</div>",
-            "</body>",
-            "</html>"
-        ])
+        with report_file.open("w", encoding="utf-8", buffering=1 << 16) as f:
+            w = f.write
+            w(REPORT_HTML_HEAD)
+            w(
+                f"<p>Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}</p>\n"
+                "<div class='section'>\n"
+                "<h2>Release Information</h2>\n"
+                f"<p><strong>Version:</strong> {html.escape(version)}</p>\n"
+                "<h3>Changes</h3>\n"
+            )
+            
+            for category, items in changes.items():
+                if items:
+                    w(f"<h4>{html.escape(category)}</h4>\n<ul>\n")
+                    w("".join(f"<li>{html.escape(item)}</li>\n" for item in items))
+                    w("</ul>\n")
+            
+            w(
+                "</div>\n"
+                "<div class='section'>\n"
+                "<h2>Release Readiness</h2>\n"
+                f"<p><strong>Status:</strong> <span class='{'success' if checks['ready'] else 'error'}'>"
+                f"{'Ready' if checks['ready'] else 'Not Ready'}</span></p>\n"
+            )
+            
+            for title, key, css_class in (
+                ("Passed Checks", "checks", "success"),
+                ("Warnings", "warnings", "warning"),
+                ("Errors", "errors", "error")
+            ):
+                if checks[key]:
+                    w(f"<h3>{title}</h3>\n<ul>\n")
+                    w("".join(
+                        f"<li class='{css_class}'>{html.escape(entry)}</li>\n"
+                        for entry in checks[key]
+                    ))
+                    w("</ul>\n")
+            
+            w(
+                "</div>\n"
+                "</body>\n"
+                "</html>"
+            )
         
-        report_file.write_text("\n".join(content))
         return report_file
 
 def parse_args() -> argparse.Namespace:
@@ -521,11 +599,16 @@ def parse_args() -> argparse.Namespace:
     # Update changelog command
     changelog_parser = subparsers.add_parser(
         "changelog",
-        help="Update changelog"
+        help="Update changelog",
+        description=(
+            "Update CHANGELOG.md from commits since the last tag. On large "
+            "repositories, run 'git commit-graph write --reachable --changed-paths' "
+            "once to speed up tag lookup and history traversal."
+        )
     )
     changelog_parser.add_argument(
         "--since",
-        help="Since tag"
+        help="Since tag (defaults to the most recent tag reachable from HEAD)"
     )
     
     # Create release command
@@ -549,6 +632,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Output in JSON format"
     )
+    check_parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first error"
+    )
     
     return parser.parse_args()
 
@@ -579,7 +667,7 @@ def main():
         
         elif args.command == "release":
             # Check readiness
-            checks = manager.check_release_readiness()
+            checks = manager.check_release_readiness(fail_fast=True)
             if not checks["ready"]:
                 logger.error("Project not ready for release:")
                 for error in checks["errors"]:
@@ -599,7 +687,7 @@ def main():
                 sys.exit(1)
         
         elif args.command == "check":
-            checks = manager.check_release_readiness()
+            checks = manager.check_release_readiness(fail_fast=args.fail_fast)
             
             if args.json:
                 print(json.dumps(checks, indent=2))
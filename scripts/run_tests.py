@@ -15,6 +15,7 @@ from typing import List, Optional, Dict
 import json
 import logging
 from datetime import datetime
+from collections import deque
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +31,9 @@ REPORTS_DIR = PROJECT_ROOT / "reports"
 COVERAGE_DIR = REPORTS_DIR / "coverage"
 JUNIT_DIR = REPORTS_DIR / "junit"
 
+# Parallel runs leave two cores free for the editor and the rest of the desktop
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 1) - 2)
+
 class TestRunner:
     """Test runner utility class."""
     
@@ -44,31 +48,47 @@ class TestRunner:
         COVERAGE_DIR.mkdir(exist_ok=True)
         JUNIT_DIR.mkdir(exist_ok=True)
     
-    def run_command(self, command: List[str]) -> subprocess.CompletedProcess:
-        """Run a command and handle its output."""
-        try:
-            return subprocess.run(
+    def run_command(
+        self,
+        command: List[str],
+        log_file: Path,
+        env: Optional[Dict[str, str]] = None
+    ) -> int:
+        """Run a command, streaming its output to a log file."""
+        with log_file.open("w") as log:
+            returncode = subprocess.run(
                 command,
-                check=True,
-                capture_output=True,
-                text=True
-            )
-        except subprocess.CalledProcessError as e:
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env=env
+            ).returncode
+        
+        if returncode != 0:
             logger.error(f"Command failed: {' '.join(command)}")
-            logger.error(f"Error output: {e.stderr}")
-            raise
+            logger.error(f"Error output:\n{self.tail_log(log_file, 20)}")
+            raise subprocess.CalledProcessError(returncode, command)
+        
+        return returncode
+    
+    def tail_log(self, log_file: Path, lines: int = 200) -> str:
+        """Return the last lines of a log file."""
+        with log_file.open() as f:
+            return "".join(deque(f, maxlen=lines))
     
     def run_tests(self, args: argparse.Namespace) -> bool:
         """Run tests with specified configuration."""
         try:
             start_time = datetime.now()
+            log_file = REPORTS_DIR / f"test-output-{start_time:%Y%m%d-%H%M%S}.log"
             
             # Build pytest command
             cmd = ["pytest"]
             
-            # Add verbosity
+            # Add verbosity (keep output small unless asked for)
             if args.verbose:
                 cmd.append("-v")
+            else:
+                cmd.extend(["-q", "--tb=line"])
             
             # Add test selection
             if args.test_path:
@@ -95,6 +115,15 @@ class TestRunner:
                     f"--junitxml={JUNIT_DIR}/test-results.xml"
                 ])
             
+            # Add structured JSON report (pytest-json-report)
+            json_report_file = None
+            if args.json_report:
+                json_report_file = REPORTS_DIR / f"pytest-{start_time:%Y%m%d-%H%M%S}.json"
+                cmd.extend([
+                    "--json-report",
+                    f"--json-report-file={json_report_file}"
+                ])
+            
             # Add last failed
             if args.last_failed:
                 cmd.append("--lf")
@@ -103,13 +132,37 @@ class TestRunner:
             if args.failed_first:
                 cmd.append("--ff")
             
+            # Run new test files first
+            if args.new_first:
+                cmd.append("--nf")
+            
+            # Only run tests affected by changes since the last testmon run
+            if args.testmon:
+                cmd.append("--testmon")
+            
+            # Stop on first failure
+            if args.exitfirst:
+                cmd.append("--exitfirst")
+            
             # Add parallel execution
             if args.parallel:
                 cmd.extend(["-n", str(args.parallel)])
+                if args.last_failed or args.failed_first:
+                    logger.warning(
+                        "Using default xdist scheduling with --last-failed/--failed-first"
+                    )
+                else:
+                    # Keep each module on one worker so its imports and fixtures are shared
+                    cmd.append("--dist=loadfile")
             
-            # Run tests
+            # Run tests without asyncio debug mode; any non-empty
+            # PYTHONASYNCIODEBUG (even "0") turns it on for every event loop
+            env = {
+                key: value for key, value in os.environ.items()
+                if key != "PYTHONASYNCIODEBUG"
+            }
             logger.info(f"Running tests: {' '.join(cmd)}")
-            result = self.run_command(cmd)
+            self.run_command(cmd, log_file, env)
             
             # Calculate duration
             duration = (datetime.now() - start_time).total_seconds()
@@ -119,9 +172,12 @@ class TestRunner:
                 "command": " ".join(cmd),
                 "success": True,
                 "duration": duration,
-                "output": result.stdout,
+                "output_log": str(log_file),
+                "tail": self.tail_log(log_file),
                 "timestamp": datetime.now().isoformat()
             }
+            if json_report_file:
+                self.test_results["json_report"] = str(json_report_file)
             
             # Generate report
             self.generate_report()
@@ -139,6 +195,7 @@ class TestRunner:
                 "command": " ".join(cmd),
                 "success": False,
                 "error": str(e),
+                "output_log": str(log_file),
                 "timestamp": datetime.now().isoformat()
             }
             return False
@@ -146,10 +203,30 @@ class TestRunner:
     def generate_report(self) -> None:
         """Generate test execution report."""
         report_file = REPORTS_DIR / f"test-report-{datetime.now():%Y%m%d-%H%M%S}.json"
+        
+        # Pull the outcome summary from pytest's own structured report
+        if "json_report" in self.test_results:
+            try:
+                with open(self.test_results["json_report"]) as f:
+                    pytest_report = json.load(f)
+                self.test_results["summary"] = pytest_report.get("summary", {})
+                self.test_results["failed"] = [
+                    test["nodeid"] for test in pytest_report.get("tests", [])
+                    if test.get("outcome") in ("failed", "error")
+                ]
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read pytest JSON report: {e}")
+        
         with open(report_file, 'w') as f:
             json.dump(self.test_results, f, indent=2)
         logger.info(f"Test report generated: {report_file}")
 
+def parallel_workers(value: str) -> str:
+    """Validate an xdist worker count: a positive integer or 'auto'."""
+    if value == "auto" or (value.isdigit() and int(value) > 0):
+        return value
+    raise argparse.ArgumentTypeError(f"expected a positive integer or 'auto', got {value!r}")
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Jarvis AI Assistant Test Runner")
@@ -195,6 +272,12 @@ def parse_args() -> argparse.Namespace:
         help="Generate JUnit XML report"
     )
     
+    parser.add_argument(
+        "--json-report",
+        action="store_true",
+        help="Generate structured pytest JSON report (requires pytest-json-report)"
+    )
+    
     parser.add_argument(
         "--last-failed",
         action="store_true",
@@ -207,10 +290,32 @@ def parse_args() -> argparse.Namespace:
         help="Run failed tests first"
     )
     
+    parser.add_argument(
+        "--new-first",
+        action="store_true",
+        help="Run tests from new files first"
+    )
+    
+    parser.add_argument(
+        "--testmon",
+        action="store_true",
+        help="Only run tests affected by code changes (requires pytest-testmon)"
+    )
+    
+    parser.add_argument(
+        "-x", "--exitfirst",
+        action="store_true",
+        help="Stop on first failure"
+    )
+    
     parser.add_argument(
         "-n", "--parallel",
-        type=int,
-        help="Number of parallel test processes"
+        type=parallel_workers,
+        nargs="?",
+        const=str(DEFAULT_WORKERS),
+        help="Number of parallel test processes, or 'auto' for one per core; "
+             f"bare -n uses {DEFAULT_WORKERS} (cores - 2) "
+             "(tests are grouped by file; requires pytest-xdist)"
     )
     
     return parser.parse_args()
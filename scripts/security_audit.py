@@ -12,10 +12,20 @@ from pathlib import Path
 import logging
 import json
 import yaml
-from typing import Dict, List, Optional, Set, Union, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union, Tuple
 import subprocess
+import threading
+import time
 import re
+import mmap
+import functools
+import importlib.util
+import multiprocessing
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import islice
 import requests
 import hashlib
 import secrets
@@ -40,6 +50,478 @@ PROJECT_ROOT = Path(__file__).parent.parent
 REPORTS_DIR = PROJECT_ROOT / "reports" / "security"
 SECRETS_DIR = PROJECT_ROOT / "secrets"
 
+# Local mirror of the safety vulnerability database, refreshed daily
+SAFETY_DB_URL = "https://raw.githubusercontent.com/pyupio/safety-db/master/data/"
+SAFETY_DB_FILES = ("insecure.json", "insecure_full.json")
+SAFETY_DB_TTL = 24 * 60 * 60
+
+# Per-file scan results memoized by content hash across runs
+FILE_HITS_FILE = ".file_hits.json"
+FILE_HITS_MAX_ENTRIES = 50000
+
+# Bumped whenever the shape or meaning of memoized per-file results changes
+FILE_HITS_VERSION = 2
+
+# Bandit configuration file, part of the code scan's cache fingerprint
+BANDIT_CONFIG_FILE = PROJECT_ROOT / ".bandit"
+
+# Directories never descended into by the secrets scan (dot-dirs are skipped too)
+WALK_SKIP_DIRS = {"node_modules", "venv", "__pycache__", "reports"}
+
+# Static head of the audit report
+REPORT_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<title>Security Audit Report</title>
+<style>
+body { font-family: Arial, sans-serif; margin: 20px; }
+.section { margin: 20px 0; padding: 20px; border: 1px solid #ddd; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+th { background-color: #f2f2f2; }
+.critical { color: #9c1f1f; }
+.high { color: #c41e3a; }
+.medium { color: #ff9800; }
+.low { color: #4caf50; }
+pre { background: #f5f5f5; padding: 10px; overflow-x: auto; }
+</style>
+</head>
+<body>
+<h1>Security Audit Report</h1>
+"""
+
+# Rows joined per write when streaming report tables
+REPORT_ROW_BATCH = 1000
+
+# Translation table escaping text for HTML element content and attributes
+HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;"
+})
+
+# Report table row templates
+SEVERITY_ROW = "<tr><td class='{s}'>{st}</td><td>{c}</td></tr>\n"
+VULN_ROW = "<tr><td>{p}</td><td class='{s}'>{st}</td><td>{d}</td></tr>\n"
+CODE_ISSUE_ROW = "<tr><td>{f}</td><td>{l}</td><td class='{s}'>{st}</td><td>{t}</td></tr>\n"
+SECRET_ROW = "<tr><td>{f}</td><td>{l}</td><td>{t}</td></tr>\n"
+DOCKER_ISSUE_ROW = "<tr><td>{l}</td><td class='{s}'>{st}</td><td>{m}</td></tr>\n"
+
+# Patterns to search for exposed secrets
+SECRET_PATTERNS = {
+    "api_key": r'(?i)api[_-]key.*[\'"][0-9a-zA-Z]{32,}[\'"]',
+    "access_token": r'(?i)access[_-]token.*[\'"][0-9a-zA-Z]{32,}[\'"]',
+    "secret_key": r'(?i)secret[_-]key.*[\'"][0-9a-zA-Z]{32,}[\'"]',
+    "password": r'(?i)password.*[\'"][^\'"\s]{8,}[\'"]',
+    "private_key": r'-----BEGIN (?:RSA )?PRIVATE KEY-----',
+    "aws_key": r'(?i)aws[_-](?:access[_-])?key[_-]id.*[\'"][A-Z0-9]{20}[\'"]',
+    "aws_secret": r'(?i)aws[_-]secret[_-]access[_-]key.*[\'"][A-Za-z0-9/+=]{40}[\'"]',
+    "github_token": r'(?i)github[_-]token.*[\'"][0-9a-zA-Z]{40}[\'"]',
+    "google_key": r'(?i)google[_-](?:api[_-])?key.*[\'"][A-Za-z0-9-_]{39}[\'"]',
+    "slack_token": r'xox[baprs]-[0-9a-zA-Z]{10,48}',
+    "stripe_key": r'(?i)stripe[_-](?:api[_-])?key.*[\'"](?:sk|pk)_(?:test|live)_[0-9a-zA-Z]{24,}'
+}
+
+# Lowercase literals that must appear for each secret pattern to match
+SECRET_ANCHORS = {
+    "api": ["api_key"],
+    "access": ["access_token"],
+    "secret": ["secret_key"],
+    "password": ["password"],
+    "-----begin": ["private_key"],
+    "aws": ["aws_key", "aws_secret"],
+    "github": ["github_token"],
+    "google": ["google_key"],
+    "xox": ["slack_token"],
+    "stripe": ["stripe_key"]
+}
+
+# Optional regex engines for the secrets scan and the module providing each,
+# in order of preference; the re module is used when none is installed
+SECRET_BACKENDS = {
+    "hyperscan": "hyperscan",
+    "rure": "rure.lib",
+    "re2": "re2"
+}
+
+# Common Dockerfile issues
+DOCKER_CHECKS = [
+    {
+        "instruction": "FROM",
+        "pattern": re.compile(r"FROM\s+[^:]+(?!:)"),
+        "severity": "high",
+        "message": "Image tag not specified, may use floating tag"
+    },
+    {
+        "instruction": "FROM",
+        "pattern": re.compile(r"FROM\s+[^@]+(?!@sha256:)"),
+        "severity": "medium",
+        "message": "Image digest not specified, consider using SHA256 digest"
+    },
+    {
+        "instruction": "RUN",
+        "pattern": re.compile(r"(?i)apt-get\s+install(?!\s+--no-install-recommends)"),
+        "severity": "low",
+        "message": "Consider using --no-install-recommends with apt-get install"
+    },
+    {
+        "instruction": "RUN",
+        "pattern": re.compile(r"(?i)apt-get(?!\s+update)"),
+        "severity": "medium",
+        "message": "apt-get update should be run before install"
+    },
+    {
+        "instruction": "RUN",
+        "pattern": re.compile(r"(?i)sudo"),
+        "severity": "medium",
+        "message": "Avoid using sudo in Dockerfile"
+    },
+    {
+        "instruction": "RUN",
+        "pattern": re.compile(r"chmod\s+777"),
+        "severity": "high",
+        "message": "Avoid using chmod 777"
+    },
+    {
+        "instruction": "ADD",
+        "pattern": re.compile(r"ADD\s+"),
+        "severity": "low",
+        "message": "Consider using COPY instead of ADD"
+    }
+]
+
+# Instructions a Dockerfile should contain
+DOCKER_BEST_PRACTICES = [
+    {
+        "instruction": "HEALTHCHECK",
+        "check": re.compile(r"HEALTHCHECK"),
+        "message": "Include HEALTHCHECK instruction"
+    },
+    {
+        "instruction": "USER",
+        "check": re.compile(r"USER\s+[^root]"),
+        "message": "Run container as non-root user"
+    },
+    {
+        "instruction": "COPY",
+        "check": re.compile(r"COPY\s+--chown="),
+        "message": "Set proper file ownership"
+    }
+]
+
+# Checks grouped by the Dockerfile instruction they apply to
+DOCKER_CHECKS_BY_INSTRUCTION = {
+    instruction: [check for check in DOCKER_CHECKS if check["instruction"] == instruction]
+    for instruction in {check["instruction"] for check in DOCKER_CHECKS}
+}
+
+@functools.lru_cache(maxsize=None)
+def _secret_backend() -> str:
+    """Pick the secrets scan's regex engine by probing for installed modules."""
+    for backend, module in SECRET_BACKENDS.items():
+        try:
+            if importlib.util.find_spec(module) is not None:
+                return backend
+        except (ImportError, ValueError):
+            continue
+    return "re"
+
+class SecretScanner:
+    """Secret matcher holding the compiled patterns and anchor prefilter."""
+    
+    def __init__(self, hits: Optional[Dict[str, List[Dict]]] = None):
+        """Initialize secret scanner with hits memoized by content hash."""
+        self.hits = hits or {}
+        
+        self.secret_types = list(SECRET_PATTERNS)
+        self.backend = _secret_backend()
+        self.hs_db = None
+        self.hs_scratch = None
+        self.rure_patterns = None
+        self.re2_patterns = None
+        self.secret_patterns = None
+        self.secret_re = None
+        
+        # Compile all secret patterns into one Hyperscan database
+        if self.backend == "hyperscan":
+            try:
+                import hyperscan
+                
+                db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                db.compile(
+                    expressions=[pattern.encode() for pattern in SECRET_PATTERNS.values()],
+                    ids=list(range(len(SECRET_PATTERNS))),
+                    flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(SECRET_PATTERNS)
+                )
+                self.hs_db = db
+                self.hs_scratch = hyperscan.Scratch(db)
+            except Exception as e:
+                logger.warning(f"Could not compile Hyperscan database: {e}")
+                self.backend = "re"  # Fall back to the re module
+        
+        # Rust's regex engine, used when it accepts every pattern
+        elif self.backend == "rure":
+            try:
+                from rure.lib import Rure
+                
+                self.rure_patterns = {
+                    secret_type: Rure(pattern.encode())
+                    for secret_type, pattern in SECRET_PATTERNS.items()
+                }
+            except Exception as e:
+                logger.warning(f"Could not compile secret patterns with rure: {e}")
+                self.backend = "re"  # Fall back to the re module
+        
+        # RE2's linear-time DFA, keeping re only for patterns it rejects
+        elif self.backend == "re2":
+            import re2
+            
+            self.re2_patterns = {}
+            for secret_type, pattern in SECRET_PATTERNS.items():
+                try:
+                    self.re2_patterns[secret_type] = re2.compile(pattern.encode())
+                except Exception:
+                    self.re2_patterns[secret_type] = re.compile(pattern.encode())
+        
+        if self.backend == "re":
+            # One byte pattern per type, run separately so overlapping secrets
+            # of different types are all reported
+            self.secret_patterns = {
+                secret_type: re.compile(pattern.encode())
+                for secret_type, pattern in SECRET_PATTERNS.items()
+            }
+            
+            # All byte patterns fused into one alternation, used only to tell
+            # whether anything matches at all; inline (?i) flags are scoped
+            # since they may not appear mid-pattern
+            self.secret_re = re.compile(b"|".join(
+                b"(?i:%s)" % pattern[4:].encode() if pattern.startswith("(?i)")
+                else b"(?:%s)" % pattern.encode()
+                for pattern in SECRET_PATTERNS.values()
+            ))
+        
+        # Case-insensitive alternation over the anchors, used as a cheap prefilter
+        self.anchor_re = re.compile(
+            b"|".join(re.escape(anchor.encode()) for anchor in SECRET_ANCHORS),
+            re.IGNORECASE
+        )
+    
+    def scan_file(self, file_path: str) -> Optional[Tuple[Optional[str], List[Dict]]]:
+        """Scan a file for secrets, returning its content hash and hits.
+        
+        Hits carry no file name so they can be memoized by content hash.
+        Returns None if the file cannot be read.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None, []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest = hashlib.blake2b(mm, digest_size=16).hexdigest()
+                    hits = self.hits.get(digest)
+                    if hits is None:
+                        hits = self._scan_data(mm)
+                    return digest, hits
+        except Exception:
+            return None
+    
+    def _scan_data(self, data) -> List[Dict]:
+        """Scan a bytes-like view of a file for secrets."""
+        # Most files contain no anchor at all and need no regex work
+        candidates = self.candidate_types(data)
+        if not candidates:
+            return []
+        
+        matches = []
+        if self.hs_db is not None:
+            # Single SIMD pass over the file for all patterns; Hyperscan needs bytes
+            data = data[:]
+            for pattern_id, start, end in self.hyperscan_matches(data):
+                matches.append((start, self.secret_types[pattern_id], data[start:end]))
+        elif self.rure_patterns is not None:
+            # Each pattern scans the whole file in Rust; rure needs bytes too
+            data = data[:]
+            for secret_type, start, end in self.rure_matches(data, candidates):
+                matches.append((start, secret_type, data[start:end]))
+        elif self.re2_patterns is not None:
+            # RE2 never backtracks, so long unterminated lines cannot stall the scan
+            data = data[:]
+            for secret_type in candidates:
+                for match in self.re2_patterns[secret_type].finditer(data):
+                    matches.append((match.start(), secret_type, match.group()))
+        elif self.secret_re.search(data):
+            for secret_type in SECRET_PATTERNS:
+                if secret_type not in candidates:
+                    continue
+                for match in self.secret_patterns[secret_type].finditer(data):
+                    matches.append((match.start(), secret_type, match.group()))
+        
+        # Line numbers are only needed once something matched
+        newlines = _linemap(data) if matches else None
+        
+        # Report each secret type at most once per line
+        found = []
+        seen = set()
+        for start, secret_type, text in matches:
+            line = bisect_left(newlines, start) + 1
+            if (line, secret_type) in seen:
+                continue
+            seen.add((line, secret_type))
+            found.append({
+                "line": line,
+                "type": secret_type,
+                "match": text[:20].decode(errors="replace") + "..."  # Truncate for safety
+            })
+        
+        return found
+    
+    def candidate_types(self, data) -> Set[str]:
+        """Get the secret types whose anchor literals occur in data."""
+        anchors = {match.group().lower().decode() for match in self.anchor_re.finditer(data)}
+        
+        return {
+            secret_type
+            for anchor in anchors
+            for secret_type in SECRET_ANCHORS[anchor]
+        }
+    
+    def rure_matches(self, data: bytes, candidates: Set[str]) -> List[Tuple[str, int, int]]:
+        """Scan bytes with rure, returning (secret type, start, end) matches."""
+        return [
+            (secret_type, match.start, match.end)
+            for secret_type in candidates
+            for match in self.rure_patterns[secret_type].find_iter(data)
+        ]
+    
+    def hyperscan_matches(self, data: bytes) -> List[Tuple[int, int, int]]:
+        """Scan bytes with Hyperscan, returning (pattern id, start, end) matches.
+        
+        Hyperscan reports every match end, so keep the longest match per start
+        and drop overlapping ones to mirror re.finditer.
+        """
+        spans = {}
+        
+        def on_match(pattern_id, start, end, flags, context):
+            if end > spans.get((pattern_id, start), -1):
+                spans[(pattern_id, start)] = end
+        
+        self.hs_db.scan(data, match_event_handler=on_match, scratch=self.hs_scratch)
+        
+        matches = []
+        last_end = {}
+        for (pattern_id, start), end in sorted(spans.items()):
+            if start >= last_end.get(pattern_id, 0):
+                matches.append((pattern_id, start, end))
+                last_end[pattern_id] = end
+        return matches
+
+def _worker_context():
+    """Get a start method safe to use while other scan threads are running.
+    
+    Scans share the process with threads doing network I/O, so worker pools
+    must not fork a copy of it that may hold their locks.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+# Per-process scanner for worker pools (compiled matchers cannot be pickled)
+_secret_scanner: Optional[SecretScanner] = None
+
+def _init_secret_worker(hits: Dict[str, List[Dict]]) -> None:
+    """Build the secret scanner once per worker process."""
+    global _secret_scanner
+    _secret_scanner = SecretScanner(hits)
+
+def _linemap(content) -> array:
+    """Get the sorted newline offsets of str or bytes-like content."""
+    newline = "\n" if isinstance(content, str) else b"\n"
+    offsets = array("q")
+    pos = content.find(newline)
+    while pos != -1:
+        offsets.append(pos)
+        pos = content.find(newline, pos + 1)
+    return offsets
+
+def _json_default(obj):
+    """Serialize sets (such as affected packages) as JSON arrays."""
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _write_rows(write, rows: Iterable[str]) -> None:
+    """Write report rows in joined batches instead of one call per row."""
+    rows = iter(rows)
+    while True:
+        batch = "".join(islice(rows, REPORT_ROW_BATCH))
+        if not batch:
+            break
+        write(batch)
+
+def _walk_files(root: str) -> Iterator[str]:
+    """Walk the tree for files, pruning hidden and skipped directories."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in WALK_SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+def _scan_secrets_file(file_path: str) -> Optional[Tuple[Optional[str], List[Dict]]]:
+    """Scan one file for secrets in a worker process."""
+    return _secret_scanner.scan_file(file_path)
+
+def _scanner_fingerprint(*config) -> str:
+    """Hash the scanner configuration that memoized per-file results depend on."""
+    return hashlib.blake2b(
+        json.dumps([FILE_HITS_VERSION, *config], sort_keys=True).encode(),
+        digest_size=16
+    ).hexdigest()
+
+def _file_digest(file_path: str) -> Tuple[str, int]:
+    """Hash a file's content and count its lines in one pass of 1 MiB chunks.
+    
+    A last line without a trailing newline still counts, as with readlines().
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    lines = 0
+    last = b"\n"
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    return digest.hexdigest(), lines + (last != b"\n")
+
+def _bandit_scan(files: List[str]) -> Dict[str, List[Dict]]:
+    """Run Bandit over a shard of files in a worker process.
+    
+    Returns each file's issues, without file names so they can be memoized
+    by content hash.
+    """
+    b_mgr = bandit_manager.BanditManager()
+    b_mgr.discover_files(files)
+    b_mgr.run_tests()
+    
+    issues = {f: [] for f in files}
+    for issue in b_mgr.get_issue_list():
+        issues.setdefault(issue.fname, []).append({
+            "line": issue.lineno,
+            "issue_type": issue.test_id,
+            "issue_text": issue.text,
+            "severity": issue.severity.lower(),
+            "confidence": issue.confidence,
+            "code": issue.get_code()
+        })
+    return issues
+
 class SecurityAuditor:
     """Security auditing utility class."""
     
@@ -58,6 +540,41 @@ class SecurityAuditor:
         except Exception as e:
             logger.warning(f"Could not initialize Docker client: {e}")
             self.docker = None
+        
+        # Memoized per-file results, shared by the concurrently running scans
+        self.file_hits_file = self.reports_dir / FILE_HITS_FILE
+        self._file_hits_lock = threading.Lock()
+    
+    def _load_file_hits(self, scan: str, fingerprint: str) -> Dict[str, object]:
+        """Load one scan's memoized per-file results.
+        
+        Results recorded under a different scanner fingerprint are discarded.
+        """
+        with self._file_hits_lock:
+            try:
+                cached = json.loads(self.file_hits_file.read_text()).get(scan, {})
+            except (OSError, ValueError):
+                return {}
+        
+        if cached.get("fingerprint") != fingerprint:
+            return {}
+        return cached.get("hits", {})
+    
+    def _save_file_hits(self, scan: str, fingerprint: str, hits: Dict[str, object]) -> None:
+        """Persist one scan's memoized results, dropping the least recently used."""
+        for digest in list(islice(hits, max(len(hits) - FILE_HITS_MAX_ENTRIES, 0))):
+            del hits[digest]
+        
+        with self._file_hits_lock:
+            try:
+                all_hits = json.loads(self.file_hits_file.read_text())
+            except (OSError, ValueError):
+                all_hits = {}
+            all_hits[scan] = {"fingerprint": fingerprint, "hits": hits}
+            try:
+                self.file_hits_file.write_text(json.dumps(all_hits))
+            except OSError as e:
+                logger.warning(f"Error saving file hits cache: {e}")
     
     def scan_dependencies(self) -> Dict:
         """Scan dependencies for security vulnerabilities."""
@@ -87,8 +604,12 @@ class SecurityAuditor:
                 if req_path.exists():
                     requirements.extend(read_requirements(str(req_path)))
             
-            # Check dependencies
-            vulns = safety_check(requirements)
+            # Check dependencies, against the local database mirror when possible
+            db_mirror = self._safety_db_mirror()
+            if db_mirror:
+                vulns = safety_check(requirements, db_mirror=db_mirror)
+            else:
+                vulns = safety_check(requirements)
             
             # Process results
             for package, vuln_id, spec, vuln_data in vulns:
@@ -108,7 +629,6 @@ class SecurityAuditor:
                 results["affected_packages"].add(package)
             
             results["total_issues"] = len(results["vulnerabilities"])
-            results["affected_packages"] = list(results["affected_packages"])
             
             return results
             
@@ -116,6 +636,28 @@ class SecurityAuditor:
             logger.error(f"Error scanning dependencies: {e}")
             return results
     
+    def _safety_db_mirror(self) -> Optional[str]:
+        """Get a local safety database mirror, downloading it if stale."""
+        cache_dir = self.reports_dir / ".safety_db"
+        try:
+            if all(
+                (cache_dir / name).exists()
+                and (cache_dir / name).stat().st_mtime > time.time() - SAFETY_DB_TTL
+                for name in SAFETY_DB_FILES
+            ):
+                return str(cache_dir)
+            
+            cache_dir.mkdir(exist_ok=True)
+            for name in SAFETY_DB_FILES:
+                response = requests.get(SAFETY_DB_URL + name, timeout=30)
+                response.raise_for_status()
+                (cache_dir / name).write_bytes(response.content)
+            return str(cache_dir)
+            
+        except Exception as e:
+            logger.warning(f"Could not refresh safety database mirror: {e}")
+            return None
+    
     def scan_code(self) -> Dict:
         """Scan code for security issues."""
         results = {
@@ -136,30 +678,49 @@ class SecurityAuditor:
             # Configure Bandit
             b_mgr = bandit_manager.BanditManager()
             b_mgr.discover_files([str(PROJECT_ROOT)])
-            b_mgr.run_tests()
+            
+            # Reuse results for files whose content is unchanged since the last
+            # run, as long as Bandit and its configuration are unchanged too
+            bandit_config = (
+                BANDIT_CONFIG_FILE.read_text() if BANDIT_CONFIG_FILE.exists() else None
+            )
+            fingerprint = _scanner_fingerprint(
+                getattr(bandit, "__version__", None),
+                bandit_config
+            )
+            code_hits = self._load_file_hits("code", fingerprint)
+            
+            # One read per file yields both its content hash and line count
+            digests = {}
+            entries = {}
+            for f in b_mgr.files_list:
+                digest, lines = _file_digest(f)
+                digests[f] = digest
+                entries[f] = code_hits.get(digest) or {"lines": lines, "issues": None}
+            
+            # Run Bandit on shards of the remaining files across worker processes
+            files = [f for f, entry in entries.items() if entry["issues"] is None]
+            shards = [files[i:i + 64] for i in range(0, len(files), 64)]
+            with ProcessPoolExecutor(mp_context=_worker_context()) as executor:
+                for shard, shard_issues in zip(shards, executor.map(_bandit_scan, shards)):
+                    for f in shard:
+                        entries[f]["issues"] = shard_issues[f]
+            
+            for f, digest in digests.items():
+                entry = entries[f]
+                code_hits.pop(digest, None)
+                code_hits[digest] = entry
+                results["issues"].extend({"file": f, **issue} for issue in entry["issues"])
+                results["stats"]["total_lines"] += entry["lines"]
+            self._save_file_hits("code", fingerprint, code_hits)
             
             # Process results
-            for issue in b_mgr.get_issue_list():
-                severity = issue.severity.lower()
-                if severity in results["severity_counts"]:
-                    results["severity_counts"][severity] += 1
-                
-                results["issues"].append({
-                    "file": issue.fname,
-                    "line": issue.lineno,
-                    "issue_type": issue.test_id,
-                    "issue_text": issue.text,
-                    "severity": severity,
-                    "confidence": issue.confidence,
-                    "code": issue.get_code()
-                })
+            for issue in results["issues"]:
+                if issue["severity"] in results["severity_counts"]:
+                    results["severity_counts"][issue["severity"]] += 1
             
             # Collect statistics
             results["stats"]["total_files"] = len(b_mgr.files_list)
-            results["stats"]["total_lines"] = sum(
-                len(open(f).readlines())
-                for f in b_mgr.files_list
-            )
             results["stats"]["total_issues"] = len(results["issues"])
             
             return results
@@ -179,44 +740,41 @@ class SecurityAuditor:
         }
         
         try:
-            # Patterns to search for
-            secret_patterns = {
-                "api_key": r'(?i)api[_-]key.*[\'"][0-9a-zA-Z]{32,}[\'"]',
-                "access_token": r'(?i)access[_-]token.*[\'"][0-9a-zA-Z]{32,}[\'"]',
-                "secret_key": r'(?i)secret[_-]key.*[\'"][0-9a-zA-Z]{32,}[\'"]',
-                "password": r'(?i)password.*[\'"][^\'"\s]{8,}[\'"]',
-                "private_key": r'-----BEGIN (?:RSA )?PRIVATE KEY-----',
-                "aws_key": r'(?i)aws[_-](?:access[_-])?key[_-]id.*[\'"][A-Z0-9]{20}[\'"]',
-                "aws_secret": r'(?i)aws[_-]secret[_-]access[_-]key.*[\'"][A-Za-z0-9/+=]{40}[\'"]',
-                "github_token": r'(?i)github[_-]token.*[\'"][0-9a-zA-Z]{40}[\'"]',
-                "google_key": r'(?i)google[_-](?:api[_-])?key.*[\'"][A-Za-z0-9-_]{39}[\'"]',
-                "slack_token": r'xox[baprs]-[0-9a-zA-Z]{10,48}',
-                "stripe_key": r'(?i)stripe[_-](?:api[_-])?key.*[\'"](?:sk|pk)_(?:test|live)_[0-9a-zA-Z]{24,}'
-            }
+            # Collect files, then scan them across worker processes
+            root = str(PROJECT_ROOT)
+            file_paths = list(_walk_files(root))
             
-            # Scan files
-            for file_path in PROJECT_ROOT.rglob("*"):
-                if file_path.is_file() and not any(
-                    part.startswith(".")
-                    for part in file_path.parts
-                ):
-                    try:
-                        content = file_path.read_text()
-                        results["stats"]["files_scanned"] += 1
-                        
-                        for secret_type, pattern in secret_patterns.items():
-                            matches = re.finditer(pattern, content)
-                            for match in matches:
-                                results["exposed_secrets"].append({
-                                    "file": str(file_path.relative_to(PROJECT_ROOT)),
-                                    "line": content.count('\n', 0, match.start()) + 1,
-                                    "type": secret_type,
-                                    "match": match.group()[:20] + "..."  # Truncate for safety
-                                })
-                                results["stats"]["secrets_found"] += 1
+            # Walked paths are rooted at root, so relative paths are plain slices
+            root_prefix_len = len(os.path.join(root, ""))
+            
+            # Workers skip files whose content hash was seen on a previous run
+            # with the same patterns and regex backend
+            fingerprint = _scanner_fingerprint(
+                SECRET_PATTERNS,
+                SECRET_ANCHORS,
+                _secret_backend()
+            )
+            secret_hits = self._load_file_hits("secrets", fingerprint)
+            with ProcessPoolExecutor(
+                mp_context=_worker_context(),
+                initializer=_init_secret_worker,
+                initargs=(secret_hits,)
+            ) as executor:
+                scanned = executor.map(_scan_secrets_file, file_paths, chunksize=64)
+                for file_path, result in zip(file_paths, scanned):
+                    if result is None:
+                        continue  # Unreadable file
+                    digest, hits = result
+                    if digest is not None:
+                        secret_hits.pop(digest, None)
+                        secret_hits[digest] = hits
                     
-                    except Exception:
-                        continue
+                    results["stats"]["files_scanned"] += 1
+                    if hits:
+                        rel_path = file_path[root_prefix_len:]
+                        results["exposed_secrets"].extend({"file": rel_path, **hit} for hit in hits)
+                        results["stats"]["secrets_found"] += len(hits)
+            self._save_file_hits("secrets", fingerprint, secret_hits)
             
             return results
             
@@ -246,80 +804,44 @@ class SecurityAuditor:
             
             content = dockerfile.read_text()
             
-            # Check for common issues
-            checks = [
-                {
-                    "pattern": r"FROM\s+[^:]+(?!:)",
-                    "severity": "high",
-                    "message": "Image tag not specified, may use floating tag"
-                },
-                {
-                    "pattern": r"FROM\s+[^@]+(?!@sha256:)",
-                    "severity": "medium",
-                    "message": "Image digest not specified, consider using SHA256 digest"
-                },
-                {
-                    "pattern": r"(?i)apt-get\s+install(?!\s+--no-install-recommends)",
-                    "severity": "low",
-                    "message": "Consider using --no-install-recommends with apt-get install"
-                },
-                {
-                    "pattern": r"(?i)apt-get(?!\s+update)",
-                    "severity": "medium",
-                    "message": "apt-get update should be run before install"
-                },
-                {
-                    "pattern": r"(?i)sudo",
-                    "severity": "medium",
-                    "message": "Avoid using sudo in Dockerfile"
-                },
-                {
-                    "pattern": r"chmod\s+777",
-                    "severity": "high",
-                    "message": "Avoid using chmod 777"
-                },
-                {
-                    "pattern": r"ADD\s+",
-                    "severity": "low",
-                    "message": "Consider using COPY instead of ADD"
-                }
-            ]
+            # Single pass over the lines, dispatching on each instruction
+            satisfied = set()
+            instruction = ""
+            continued = False
+            for line_number, line in enumerate(content.splitlines(), 1):
+                stripped = line.strip()
+                if not stripped or stripped.startswith("#"):
+                    continue
+                
+                # Continuation lines belong to the instruction that started them
+                if not continued:
+                    instruction = stripped.split(None, 1)[0].upper()
+                continued = stripped.endswith("\\")
+                
+                # Check for common issues
+                for check in DOCKER_CHECKS_BY_INSTRUCTION.get(instruction, ()):
+                    for match in check["pattern"].finditer(line):
+                        results["issues"].append({
+                            "line": line_number,
+                            "severity": check["severity"],
+                            "message": check["message"],
+                            "code": match.group().strip()
+                        })
+                        
+                        results["stats"]["severity_counts"][check["severity"]] += 1
+                        results["stats"]["total_issues"] += 1
+                
+                # Check best practices
+                for practice in DOCKER_BEST_PRACTICES:
+                    if practice["instruction"] == instruction and practice["check"].search(line):
+                        satisfied.add(practice["message"])
             
-            for check in checks:
-                matches = re.finditer(check["pattern"], content)
-                for match in matches:
-                    line_number = content.count('\n', 0, match.start()) + 1
-                    
-                    results["issues"].append({
-                        "line": line_number,
-                        "severity": check["severity"],
-                        "message": check["message"],
-                        "code": match.group().strip()
-                    })
-                    
-                    results["stats"]["severity_counts"][check["severity"]] += 1
-                    results["stats"]["total_issues"] += 1
-            
-            # Check best practices
-            best_practices = [
-                {
-                    "check": r"HEALTHCHECK",
-                    "message": "Include HEALTHCHECK instruction"
-                },
-                {
-                    "check": r"USER\s+[^root]",
-                    "message": "Run container as non-root user"
-                },
-                {
-                    "check": r"COPY\s+--chown=",
-                    "message": "Set proper file ownership"
-                }
+            results["best_practices"] = [
+                practice["message"]
+                for practice in DOCKER_BEST_PRACTICES
+                if practice["message"] not in satisfied
             ]
             
-            for practice in best_practices:
-                if not re.search(practice["check"], content):
-                    results["best_practices"].append(practice["message"])
-            
             return results
             
         except Exception as e:
@@ -334,162 +856,137 @@ class SecurityAuditor:
         docker_results: Optional[Dict] = None
     ) -> Path:
         """Generate security audit report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         report_file = self.reports_dir / f"security_report_{timestamp}.html"
         
-        content = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            "<title>Security Audit Report</title>",
-            "<style>",
-            "body { font-family: Arial, sans-serif; margin: 20px; }",
-            ".section { margin: 20px 0; padding: 20px; border: 1px solid #ddd; }",
-            "table { border-collapse: collapse; width: 100%; }",
-            "th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }",
-            "th { background-color: #f2f2f2; }",
-            ".critical { color: #9c1f1f; }",
-            ".high { color: #c41e3a; }",
-            ".medium { color: #ff9800; }",
-            ".low { color: #4caf50; }",
-            "pre { background: #f5f5f5; padding: 10px; overflow-x: auto; }",
-            "</style>",
-            "</head>",
-            "<body>",
-            "<h1>Security Audit Report</h1>",
-            f"<p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>"
-        ]
-        
-        # Dependency section
-        if dependency_results:
-            content.extend([
-                "<div class='section'>",
-                "<h2>Dependency Security Scan</h2>",
-                f"<p>Total Issues: {dependency_results['total_issues']}</p>",
-                "<h3>Severity Distribution</h3>",
-                "<table>",
-                "<tr><th>Severity</th><th>Count</th></tr>"
-            ])
-            
-            for severity, count in dependency_results["severity_counts"].items():
-                content.append(
-                    f"<tr><td class='{severity}'>{severity.title()}</td>"
-                    f"<td>{count}</td></tr>"
-                )
+        with report_file.open("w", encoding="utf-8", buffering=1 << 16) as f:
+            w = f.write
+            w(REPORT_HTML_HEAD)
+            w(f"<p>Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}</p>\n")
             
-            content.extend([
-                "</table>",
-                "<h3>Vulnerabilities</h3>",
-                "<table>",
-                "<tr><th>Package</th><th>Severity</th><th>Description</th></tr>"
-            ])
-            
-            for vuln in dependency_results["vulnerabilities"]:
-                content.append(
-                    f"<tr><td>{vuln['package']}</td>"
-                    f"<td class='{vuln['severity']}'>{vuln['severity'].title()}</td>"
-                    f"<td>{vuln['description']}</td></tr>"
+            # Dependency section
+            if dependency_results:
+                w(
+                    "<div class='section'>\n"
+                    "<h2>Dependency Security Scan</h2>\n"
+                    f"<p>Total Issues: {dependency_results['total_issues']}</p>\n"
+                    "<h3>Severity Distribution</h3>\n"
+                    "<table>\n"
+                    "<tr><th>Severity</th><th>Count</th></tr>\n"
                 )
+                _write_rows(w, (
+                    SEVERITY_ROW.format(s=severity, st=severity.title(), c=count)
+                    for severity, count in dependency_results["severity_counts"].items()
+                ))
+                w(
+                    "</table>\n"
+                    "<h3>Vulnerabilities</h3>\n"
+                    "<table>\n"
+                    "<tr><th>Package</th><th>Severity</th><th>Description</th></tr>\n"
+                )
+                _write_rows(w, (
+                    VULN_ROW.format(
+                        p=str(vuln["package"]).translate(HTML_ESCAPE_TABLE),
+                        s=vuln["severity"].translate(HTML_ESCAPE_TABLE),
+                        st=vuln["severity"].title().translate(HTML_ESCAPE_TABLE),
+                        d=vuln["description"].translate(HTML_ESCAPE_TABLE)
+                    )
+                    for vuln in dependency_results["vulnerabilities"]
+                ))
+                w("</table>\n</div>\n")
             
-            content.extend([
-                "</table>",
-                "</div>"
-            ])
-        
-        # Code scan section
-        if code_results:
-            content.extend([
-                "<div class='section'>",
-                "<h2>Code Security Scan</h2>",
-                "<h3>Statistics</h3>",
-                "<ul>",
-                f"<li>Files Scanned: {code_results['stats']['total_files']}</li>",
-                f"<li>Lines of Code: {code_results['stats']['total_lines']}</li>",
-                f"<li>Issues Found: {code_results['stats']['total_issues']}</li>",
-                "</ul>",
-                "<h3>Issues</h3>",
-                "<table>",
-                "<tr><th>File</th><th>Line</th><th>Severity</th><th>Issue</th></tr>"
-            ])
-            
-            for issue in code_results["issues"]:
-                content.append(
-                    f"<tr><td>{issue['file']}</td><td>{issue['line']}</td>"
-                    f"<td class='{issue['severity']}'>{issue['severity'].title()}</td>"
-                    f"<td>{issue['issue_text']}</td></tr>"
+            # Code scan section
+            if code_results:
+                w(
+                    "<div class='section'>\n"
+                    "<h2>Code Security Scan</h2>\n"
+                    "<h3>Statistics</h3>\n"
+                    "<ul>\n"
+                    f"<li>Files Scanned: {code_results['stats']['total_files']}</li>\n"
+                    f"<li>Lines of Code: {code_results['stats']['total_lines']}</li>\n"
+                    f"<li>Issues Found: {code_results['stats']['total_issues']}</li>\n"
+                    "</ul>\n"
+                    "<h3>Issues</h3>\n"
+                    "<table>\n"
+                    "<tr><th>File</th><th>Line</th><th>Severity</th><th>Issue</th></tr>\n"
                 )
+                _write_rows(w, (
+                    CODE_ISSUE_ROW.format(
+                        f=issue["file"].translate(HTML_ESCAPE_TABLE),
+                        l=issue["line"],
+                        s=issue["severity"],
+                        st=issue["severity"].title(),
+                        t=issue["issue_text"].translate(HTML_ESCAPE_TABLE)
+                    )
+                    for issue in code_results["issues"]
+                ))
+                w("</table>\n</div>\n")
             
-            content.extend([
-                "</table>",
-                "</div>"
-            ])
-        
-        # Secrets scan section
-        if secrets_results:
-            content.extend([
-                "<div class='section'>",
-                "<h2>Secrets Scan</h2>",
-                "<h3>Statistics</h3>",
-                "<ul>",
-                f"<li>Files Scanned: {secrets_results['stats']['files_scanned']}</li>",
-                f"<li>Secrets Found: {secrets_results['stats']['secrets_found']}</li>",
-                "</ul>"
-            ])
-            
-            if secrets_results["exposed_secrets"]:
-                content.extend([
-                    "<h3>Exposed Secrets</h3>",
-                    "<table>",
-                    "<tr><th>File</th><th>Line</th><th>Type</th></tr>"
-                ])
+            # Secrets scan section
+            if secrets_results:
+                w(
+                    "<div class='section'>\n"
+                    "<h2>Secrets Scan</h2>\n"
+                    "<h3>Statistics</h3>\n"
+                    "<ul>\n"
+                    f"<li>Files Scanned: {secrets_results['stats']['files_scanned']}</li>\n"
+                    f"<li>Secrets Found: {secrets_results['stats']['secrets_found']}</li>\n"
+                    "</ul>\n"
+                )
                 
-                for secret in secrets_results["exposed_secrets"]:
-                    content.append(
-                        f"<tr><td>{secret['file']}</td><td>{secret['line']}</td>"
-                        f"<td>{secret['type']}</td></tr>"
+                if secrets_results["exposed_secrets"]:
+                    w(
+                        "<h3>Exposed Secrets</h3>\n"
+                        "<table>\n"
+                        "<tr><th>File</th><th>Line</th><th>Type</th></tr>\n"
                     )
+                    _write_rows(w, (
+                        SECRET_ROW.format(
+                            f=secret["file"].translate(HTML_ESCAPE_TABLE),
+                            l=secret["line"],
+                            t=secret["type"]
+                        )
+                        for secret in secrets_results["exposed_secrets"]
+                    ))
+                    w("</table>\n")
                 
-                content.append("</table>")
-            
-            content.append("</div>")
-        
-        # Docker scan section
-        if docker_results:
-            content.extend([
-                "<div class='section'>",
-                "<h2>Docker Security Scan</h2>",
-                "<h3>Issues</h3>",
-                "<table>",
-                "<tr><th>Line</th><th>Severity</th><th>Message</th></tr>"
-            ])
-            
-            for issue in docker_results["issues"]:
-                content.append(
-                    f"<tr><td>{issue['line']}</td>"
-                    f"<td class='{issue['severity']}'>{issue['severity'].title()}</td>"
-                    f"<td>{issue['message']}</td></tr>"
-                )
-            
-            content.extend([
-                "</table>",
-                "<h3>Best Practices</h3>",
-                "<ul>"
-            ])
+                w("</div>\n")
             
-            for practice in docker_results["best_practices"]:
-                content.append(f"<li>{practice}</li>")
+            # Docker scan section
+            if docker_results:
+                w(
+                    "<div class='section'>\n"
+                    "<h2>Docker Security Scan</h2>\n"
+                    "<h3>Issues</h3>\n"
+                    "<table>\n"
+                    "<tr><th>Line</th><th>Severity</th><th>Message</th></tr>\n"
+                )
+                _write_rows(w, (
+                    DOCKER_ISSUE_ROW.format(
+                        l=issue["line"],
+                        s=issue["severity"],
+                        st=issue["severity"].title(),
+                        m=issue["message"]
+                    )
+                    for issue in docker_results["issues"]
+                ))
+                w(
+                    "</table>\n"
+                    "<h3>Best Practices</h3>\n"
+                    "<ul>\n"
+                )
+                _write_rows(w, (
+                    f"<li>{practice}</li>\n"
+                    for practice in docker_results["best_practices"]
+                ))
+                w("</ul>\n</div>\n")
             
-            content.extend([
-                "</ul>",
-                "</div>"
-            ])
-        
-        content.extend([
-            "</body>",
-            "</html>"
-        ])
+            w(
+                "</body>\n"
+                "</html>"
+            )
         
-        report_file.write_text("\n".join(content))
         return report_file
 
 def parse_args() -> argparse.Namespace:
@@ -538,25 +1035,35 @@ def main():
     try:
         results = {}
         
-        # Run scans
-        if not args.skip_deps:
-            logger.info("Scanning dependencies...")
-            results["dependencies"] = auditor.scan_dependencies()
+        # Run independent scans concurrently
+        scans = [
+            ("dependencies", "Scanning dependencies...", auditor.scan_dependencies, args.skip_deps),
+            ("code", "Scanning code...", auditor.scan_code, args.skip_code),
+            ("secrets", "Scanning for secrets...", auditor.scan_secrets, args.skip_secrets),
+            ("docker", "Scanning Docker configuration...", auditor.scan_docker, args.skip_docker)
+        ]
         
-        if not args.skip_code:
-            logger.info("Scanning code...")
-            results["code"] = auditor.scan_code()
+        def run_scan(message, scan):
+            logger.info(message)
+            return scan()
         
-        if not args.skip_secrets:
-            logger.info("Scanning for secrets...")
-            results["secrets"] = auditor.scan_secrets()
+        with ThreadPoolExecutor(max_workers=len(scans)) as executor:
+            futures = {
+                executor.submit(run_scan, message, scan): name
+                for name, message, scan, skip in scans
+                if not skip
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         
-        if not args.skip_docker:
-            logger.info("Scanning Docker configuration...")
-            results["docker"] = auditor.scan_docker()
+        # Keep the output in scan order regardless of completion order
+        results = {name: results[name] for name, _, _, _ in scans if name in results}
         
         if args.json:
-            print(json.dumps(results, indent=2))
+            # Stream straight to stdout; pretty-print only for a terminal
+            indent = 2 if sys.stdout.isatty() else None
+            json.dump(results, sys.stdout, indent=indent, default=_json_default)
+            sys.stdout.write("\n")
         else:
             report_file = auditor.generate_report(
                 results.get("dependencies"),
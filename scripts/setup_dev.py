@@ -5,6 +5,7 @@ This script automates the setup of a development environment with all necessary
 dependencies, tools, and configurations.
 """
 
+import argparse
 import os
 import sys
 import subprocess
@@ -13,11 +14,16 @@ from pathlib import Path
 import logging
 import json
 import shutil
+import hashlib
 import venv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import pkg_resources
 import re
 
+from tool_probe import probe_all, probe_cache_hit, probe_cache_key, save_probe_cache
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,12 +34,27 @@ logger = logging.getLogger(__name__)
 # Constants
 PROJECT_ROOT = Path(__file__).parent.parent
 VENV_DIR = PROJECT_ROOT / ".venv"
+SETUP_CACHE_FILE = VENV_DIR / ".setup_cache.json"
+REQ_HASH_FILE = VENV_DIR / ".req_hash"
+SETUP_MANIFEST_FILE = VENV_DIR / ".setup_manifest"
+PRE_COMMIT_HOME = VENV_DIR / ".pre-commit-cache"
+ENVRC_FILE = PROJECT_ROOT / ".envrc"
+COMMAND_OUTPUT_TAIL = 200  # lines of command output kept for error reports
+
+# Wheel cache shared by every checkout; CI can point this at a restored cache
+WHEEL_CACHE_DIR = Path(
+    os.environ.get("JARVIS_WHEEL_CACHE", Path.home() / ".cache" / "jarvis-wheels")
+)
 REQUIREMENTS = {
     "core": PROJECT_ROOT / "requirements.txt",
     "dev": PROJECT_ROOT / "requirements-dev.txt",
     "docs": PROJECT_ROOT / "requirements-docs.txt",
     "test": PROJECT_ROOT / "requirements-test.txt"
 }
+REQUIREMENTS_LOCK = PROJECT_ROOT / "requirements.lock"
+
+# Pinned hash marker in a fully locked requirements file
+REQ_HASH_RE = re.compile(r"--hash=\w+:[0-9a-f]+")
 
 class DevEnvironment:
     """Development environment setup utility class."""
@@ -50,23 +71,34 @@ class DevEnvironment:
     
     def _run_command(self, command: List[str], **kwargs) -> subprocess.CompletedProcess:
         """Run a command and handle its output."""
-        try:
-            return subprocess.run(
-                command,
-                check=True,
-                capture_output=True,
-                text=True,
-                **kwargs
-            )
-        except subprocess.CalledProcessError as e:
+        # Stream merged output line by line, keeping only the tail for errors
+        tail = deque(maxlen=COMMAND_OUTPUT_TAIL)
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            **kwargs
+        ) as proc:
+            for line in proc.stdout:
+                tail.append(line)
+                logger.debug(line.rstrip())
+            returncode = proc.wait()
+        
+        output = "".join(tail)
+        if returncode:
             logger.error(f"Command failed: {' '.join(command)}")
-            logger.error(f"Error output: {e.stderr}")
-            raise
+            logger.error(f"Error output: {output}")
+            raise subprocess.CalledProcessError(returncode, command, output=output)
+        return subprocess.CompletedProcess(command, returncode, stdout=output)
     
     def check_system_dependencies(self) -> bool:
         """Check system dependencies."""
         logger.info("Checking system dependencies...")
         
+        if not shutil.which("uv"):
+            logger.info("Tip: install uv (https://docs.astral.sh/uv/) for much faster requirement installs")
+        
         dependencies = {
             "git": "Git version control",
             "python3": "Python interpreter",
@@ -75,12 +107,20 @@ class DevEnvironment:
             "npm": "Node.js package manager"
         }
         
+        # Skip the probes if the same tools passed on a previous run
+        key = probe_cache_key(list(dependencies))
+        if probe_cache_hit(SETUP_CACHE_FILE, key):
+            logger.info("✓ System dependencies unchanged since last check")
+            return True
+        
+        # Probe all tools concurrently, then report in a fixed order
+        found = probe_all(list(dependencies))
+        
         missing = []
-        for cmd, desc in dependencies.items():
-            try:
-                self._run_command([cmd, "--version"])
+        for (cmd, desc), ok in zip(dependencies.items(), found):
+            if ok:
                 logger.info(f"✓ {desc} found")
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            else:
                 missing.append(f"✗ {desc} not found")
         
         if missing:
@@ -89,6 +129,11 @@ class DevEnvironment:
                 logger.error(msg)
             return False
         
+        # Only cache into an existing venv; creating the directory here would
+        # make create_virtual_environment skip creating the venv
+        if VENV_DIR.exists():
+            save_probe_cache(SETUP_CACHE_FILE, key)
+        
         return True
     
     def create_virtual_environment(self) -> bool:
@@ -100,16 +145,11 @@ class DevEnvironment:
                 logger.warning("Virtual environment already exists")
                 return True
             
-            venv.create(VENV_DIR, with_pip=True)
-            
-            # Get path to Python executable in venv
-            if self.is_windows:
-                python_path = VENV_DIR / "Scripts" / "python.exe"
-            else:
-                python_path = VENV_DIR / "bin" / "python"
-            
-            # Upgrade pip
-            self._run_command([str(python_path), "-m", "pip", "install", "--upgrade", "pip"])
+            # Symlink the interpreter instead of copying it where supported. The
+            # pip bundled by ensurepip is used as is; upgrading it costs another
+            # interpreter start and resolve
+            builder = venv.EnvBuilder(with_pip=True, symlinks=not self.is_windows)
+            builder.create(str(VENV_DIR))
             
             logger.info("Virtual environment created successfully")
             return True
@@ -123,24 +163,67 @@ class DevEnvironment:
         try:
             logger.info("Installing project requirements...")
             
-            # Get path to pip in venv
+            # Get paths to Python and pip in venv
             if self.is_windows:
+                python_path = VENV_DIR / "Scripts" / "python.exe"
                 pip_path = VENV_DIR / "Scripts" / "pip.exe"
             else:
+                python_path = VENV_DIR / "bin" / "python"
                 pip_path = VENV_DIR / "bin" / "pip"
             
-            # Install core requirements
-            self._run_command([
-                str(pip_path), "install", "-r", str(REQUIREMENTS["core"])
+            # Prefer uv's parallel resolver and installer when it is installed
+            uv = shutil.which("uv")
+            installer = [uv] if uv else [str(pip_path)]
+            
+            if REQUIREMENTS_LOCK.exists():
+                req_paths = [REQUIREMENTS_LOCK]
+            else:
+                req_paths = [REQUIREMENTS["core"]]
+                if dev:
+                    for req_file in ["dev", "docs", "test"]:
+                        if REQUIREMENTS[req_file].exists():
+                            req_paths.append(REQUIREMENTS[req_file])
+            
+            # Skip installing if the requirements, interpreter and installer are unchanged
+            digest = hashlib.sha256()
+            for req_path in req_paths:
+                digest.update(req_path.name.encode())
+                digest.update(req_path.read_bytes())
+            digest.update(sys.version.encode())
+            digest.update(self._run_command([*installer, "--version"]).stdout.encode())
+            req_hash = digest.hexdigest()
+            
+            if REQ_HASH_FILE.exists() and REQ_HASH_FILE.read_text() == req_hash:
+                logger.info("Requirements unchanged, skipping installation")
+                return True
+            
+            # Fully hash-pinned requirements already list every dependency,
+            # so pip's resolver can be skipped
+            if uv:
+                # uv only upgrades when needed by default
+                command = [uv, "pip", "install", "--python", str(python_path)]
+            else:
+                command = [str(pip_path), "install"]
+            if all(REQ_HASH_RE.search(req_path.read_text()) for req_path in req_paths):
+                command.extend(["--no-deps", "--require-hashes"])
+            elif not uv:
+                command.extend(["--upgrade-strategy", "only-if-needed"])
+            
+            # Reuse downloaded and built wheels, and any prebuilt wheelhouse;
+            # uv's cache layout differs from pip's, so each gets its own
+            wheelhouse = WHEEL_CACHE_DIR / "wheelhouse"
+            wheelhouse.mkdir(parents=True, exist_ok=True)
+            command.extend([
+                "--cache-dir", str(WHEEL_CACHE_DIR / ("uv" if uv else "pip")),
+                "--find-links", str(wheelhouse)
             ])
             
-            if dev:
-                # Install development requirements
-                for req_file in ["dev", "docs", "test"]:
-                    if REQUIREMENTS[req_file].exists():
-                        self._run_command([
-                            str(pip_path), "install", "-r", str(REQUIREMENTS[req_file])
-                        ])
+            # Install core and development requirements in one resolve
+            for req_path in req_paths:
+                command.extend(["-r", str(req_path)])
+            
+            self._run_command(command)
+            REQ_HASH_FILE.write_text(req_hash)
             
             logger.info("Requirements installed successfully")
             return True
@@ -160,8 +243,16 @@ class DevEnvironment:
             else:
                 pre_commit = VENV_DIR / "bin" / "pre-commit"
             
-            self._run_command([str(pre_commit), "install"])
-            self._run_command([str(pre_commit), "install-hooks"])
+            # Keep hook environments in the venv so they survive between runs
+            env = {**os.environ, "PRE_COMMIT_HOME": str(PRE_COMMIT_HOME)}
+            self._run_command([str(pre_commit), "install"], env=env)
+            self._run_command([str(pre_commit), "install-hooks"], env=env)
+            
+            # Export the same cache location for shells using direnv
+            export = 'export PRE_COMMIT_HOME="$PWD/.venv/.pre-commit-cache"\n'
+            envrc = ENVRC_FILE.read_text() if ENVRC_FILE.exists() else ""
+            if "PRE_COMMIT_HOME" not in envrc:
+                ENVRC_FILE.write_text(envrc + export)
             
             logger.info("Git hooks set up successfully")
             return True
@@ -216,12 +307,12 @@ class DevEnvironment:
                 "editor.formatOnSave": True,
                 "editor.rulers": [88, 100],
                 "files.trimTrailingWhitespace": True,
-                "files.insertFinalNewline": True
+                "files.insertFinalNewline": True,
+                "terminal.integrated.env.linux": {"PRE_COMMIT_HOME": str(PRE_COMMIT_HOME)},
+                "terminal.integrated.env.osx": {"PRE_COMMIT_HOME": str(PRE_COMMIT_HOME)},
+                "terminal.integrated.env.windows": {"PRE_COMMIT_HOME": str(PRE_COMMIT_HOME)}
             }
             
-            with open(vscode_dir / "settings.json", "w") as f:
-                json.dump(settings, f, indent=4)
-            
             # Create launch.json
             launch = {
                 "version": "0.2.0",
@@ -243,8 +334,13 @@ class DevEnvironment:
                 ]
             }
             
-            with open(vscode_dir / "launch.json", "w") as f:
-                json.dump(launch, f, indent=4)
+            # Encode both bodies up front, then write the two files side by side
+            files = {
+                vscode_dir / "settings.json": json.dumps(settings, indent=4).encode(),
+                vscode_dir / "launch.json": json.dumps(launch, indent=4).encode()
+            }
+            with ThreadPoolExecutor(max_workers=len(files)) as executor:
+                list(executor.map(Path.write_bytes, files.keys(), files.values()))
             
             logger.info("IDE configuration set up successfully")
             return True
@@ -277,8 +373,49 @@ class DevEnvironment:
             logger.error(f"Error setting up documentation: {e}")
             return False
 
+def setup_manifest_key() -> str:
+    """Hash every input that affects the result of a full setup run."""
+    key = hashlib.blake2b()
+    inputs = [
+        *REQUIREMENTS.values(),
+        REQUIREMENTS_LOCK,
+        Path(__file__),
+        PROJECT_ROOT / "scripts" / "db_manager.py",
+        PROJECT_ROOT / "scripts" / "build_docs.py",
+        PROJECT_ROOT / "scripts" / "setup_git_hooks.py",
+        *sorted((PROJECT_ROOT / "scripts" / "git_hooks").glob("*.sh"))
+    ]
+    for path in inputs:
+        key.update(str(path.relative_to(PROJECT_ROOT)).encode())
+        key.update(path.read_bytes() if path.exists() else b"")
+    return key.hexdigest()
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Jarvis AI Assistant development environment setup"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every setup step even if no inputs changed since the last run"
+    )
+    return parser.parse_args()
+
 def main():
     """Main function."""
+    args = parse_args()
+    
+    # Skip the whole run when nothing it depends on has changed
+    manifest_key = setup_manifest_key()
+    if (
+        not args.force
+        and SETUP_MANIFEST_FILE.exists()
+        and SETUP_MANIFEST_FILE.read_text() == manifest_key
+    ):
+        logger.info("Development environment setup up-to-date (use --force to rerun)")
+        return
+    
     env = DevEnvironment()
     
     # Check system dependencies
@@ -293,21 +430,22 @@ def main():
     if not env.install_requirements():
         sys.exit(1)
     
-    # Set up Git hooks
-    if not env.setup_git_hooks():
-        sys.exit(1)
+    # Set up Git hooks, database, IDE configuration and documentation; these
+    # touch disjoint resources, so run them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(env.setup_git_hooks),
+            executor.submit(env.setup_database),
+            executor.submit(env.setup_ide_config),
+            executor.submit(env.setup_documentation)
+        ]
+        results = [future.result() for future in futures]
     
-    # Set up database
-    if not env.setup_database():
+    if not all(results):
         sys.exit(1)
     
-    # Set up IDE configuration
-    if not env.setup_ide_config():
-        sys.exit(1)
-    
-    # Set up documentation
-    if not env.setup_documentation():
-        sys.exit(1)
+    # Record the inputs only once every step has succeeded
+    SETUP_MANIFEST_FILE.write_text(manifest_key)
     
     logger.info("\nDevelopment environment setup completed successfully!")
     logger.info("\nNext steps:")
@@ -6,13 +6,17 @@ This script sets up custom Git hooks for maintaining code quality and consistenc
 
 import os
 import sys
-import stat
 from pathlib import Path
 import shutil
+import functools
+import string
 import subprocess
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 import logging
 
+from tool_probe import probe_all, probe_cache_hit, probe_cache_key, save_probe_cache
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,130 +28,26 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).parent.parent
 HOOKS_DIR = PROJECT_ROOT / ".git" / "hooks"
 CUSTOM_HOOKS_DIR = PROJECT_ROOT / "scripts" / "git_hooks"
-
-# Hook definitions
-HOOKS: Dict[str, str] = {
-    "pre-commit": """#!/bin/bash
-set -e
-
-echo "Running pre-commit checks..."
-
-# Check for debug statements
-echo "Checking for debug statements..."
-! git diff --cached --name-only | xargs grep -l "import pdb" || (echo "Error: Found pdb imports" && exit 1)
-! git diff --cached --name-only | xargs grep -l "breakpoint()" || (echo "Error: Found breakpoint() calls" && exit 1)
-
-# Run code formatting
-echo "Running code formatting..."
-black --check .
-
-# Run linting
-echo "Running linters..."
-flake8 .
-pylint $(git ls-files '*.py')
-
-# Run type checking
-echo "Running type checking..."
-mypy .
-
-# Run tests
-echo "Running tests..."
-pytest tests/
-
-# Check for large files
-echo "Checking for large files..."
-git diff --cached --name-only | while read file; do
-    if [ -f "$file" ]; then
-        size=$(stat -f%z "$file" 2>/dev/null || stat -c%s "$file" 2>/dev/null)
-        if [ "$size" -gt 5242880 ]; then  # 5MB
-            echo "Error: $file is too large ($size bytes)"
-            exit 1
-        fi
-    fi
-done
-
-echo "All pre-commit checks passed!"
-""",
-
-    "pre-push": """#!/bin/bash
-set -e
-
-echo "Running pre-push checks..."
-
-# Run full test suite
-echo "Running full test suite..."
-pytest tests/ --cov=. --cov-report=term-missing
-
-# Check documentation build
-echo "Checking documentation build..."
-python scripts/build_docs.py --check
-
-# Run security checks
-echo "Running security checks..."
-bandit -r .
-
-echo "All pre-push checks passed!"
-""",
-
-    "commit-msg": """#!/bin/bash
-set -e
-
-# Get the commit message
-commit_msg_file="$1"
-commit_msg=$(cat "$commit_msg_file")
-
-# Patterns for conventional commits
-conventional_pattern="^(feat|fix|docs|style|refactor|test|chore|perf|ci|build|revert)(\([a-z]+\))?: .+"
-
-if ! echo "$commit_msg" | grep -qE "$conventional_pattern"; then
-    echo "Error: Commit message does not follow conventional commits format."
-    echo "Format: <type>(<scope>): <description>"
-    echo "Types: feat, fix, docs, style, refactor, test, chore, perf, ci, build, revert"
-    echo "Example: feat(ui): add new settings dialog"
-    exit 1
-fi
-
-# Check message length
-if [ ${#commit_msg} -gt 72 ]; then
-    echo "Error: Commit message is too long (max 72 characters)"
-    exit 1
-fi
-""",
-
-    "post-checkout": """#!/bin/bash
-set -e
-
-# Check if dependencies have changed
-if [ -f "requirements.txt" ]; then
-    if git diff --name-only $1 $2 | grep -q "requirements.txt"; then
-        echo "Dependencies have changed. Running pip install..."
-        pip install -r requirements.txt
-    fi
-fi
-
-# Rebuild documentation if docs have changed
-if git diff --name-only $1 $2 | grep -q "^docs/"; then
-    echo "Documentation has changed. Rebuilding..."
-    python scripts/build_docs.py
-fi
-""",
-
-    "post-merge": """#!/bin/bash
-set -e
-
-# Check if dependencies have changed
-if git diff --name-only HEAD@{1} HEAD | grep -q "requirements.txt"; then
-    echo "Dependencies have changed. Running pip install..."
-    pip install -r requirements.txt
-fi
-
-# Rebuild documentation if docs have changed
-if git diff --name-only HEAD@{1} HEAD | grep -q "^docs/"; then
-    echo "Documentation has changed. Rebuilding..."
-    python scripts/build_docs.py
-fi
-"""
-}
+TOOLS_CACHE_FILE = PROJECT_ROOT / ".git" / ".hooks_tools_cache.json"
+
+VENV_DIR = PROJECT_ROOT / ".venv"
+VENV_PYTHON = VENV_DIR / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+
+# Hook templates live in CUSTOM_HOOKS_DIR as <name>.sh
+HOOK_NAMES: List[str] = [
+    "pre-commit",
+    "pre-push",
+    "commit-msg",
+    "post-checkout",
+    "post-merge",
+]
+
+@functools.lru_cache(maxsize=None)
+def render_hook(name: str) -> str:
+    """Load a hook template and fill in the venv interpreter path."""
+    template = string.Template((CUSTOM_HOOKS_DIR / f"{name}.sh").read_text())
+    # safe_substitute leaves the hooks' own shell variables untouched
+    return template.safe_substitute(JARVIS_VENV_PYTHON=str(VENV_PYTHON))
 
 def check_git_repo() -> bool:
     """Check if current directory is a git repository."""
@@ -170,11 +70,16 @@ def install_hook(name: str, content: str) -> None:
     """Install a git hook with the given name and content."""
     hook_path = HOOKS_DIR / name
     try:
-        # Write hook content
-        hook_path.write_text(content)
+        # Unlink first so a hardlinked backup of the old hook is not overwritten;
+        # this also means the file is always created with the executable mode
+        hook_path.unlink(missing_ok=True)
         
-        # Make hook executable
-        hook_path.chmod(hook_path.stat().st_mode | stat.S_IEXEC)
+        # Write hook content, created executable
+        fd = os.open(hook_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            os.write(fd, content.encode())
+        finally:
+            os.close(fd)
         
         logger.info(f"Installed {name} hook")
     except Exception as e:
@@ -188,7 +93,19 @@ def backup_existing_hooks() -> None:
         try:
             if backup_dir.exists():
                 shutil.rmtree(backup_dir)
-            shutil.copytree(HOOKS_DIR, backup_dir)
+            
+            # Hardlink instead of copying; install_hook replaces hooks rather
+            # than rewriting them, so the linked backups stay intact
+            backup_dir.mkdir(parents=True)
+            for src in HOOKS_DIR.iterdir():
+                dst = backup_dir / src.name
+                if src.is_dir():
+                    shutil.copytree(src, dst)
+                    continue
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copy2(src, dst)
             logger.info(f"Backed up existing hooks to {backup_dir}")
         except Exception as e:
             logger.error(f"Error backing up existing hooks: {e}")
@@ -205,22 +122,21 @@ def check_dependencies() -> bool:
         "bandit"
     ]
     
-    missing_tools = []
-    for tool in required_tools:
-        try:
-            subprocess.run(
-                [tool, "--version"],
-                check=True,
-                capture_output=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            missing_tools.append(tool)
+    # Skip the probes if the same tools passed on a previous run
+    key = probe_cache_key(required_tools)
+    if probe_cache_hit(TOOLS_CACHE_FILE, key):
+        return True
+    
+    found = probe_all(required_tools)
+    
+    missing_tools = [tool for tool, ok in zip(required_tools, found) if not ok]
     
     if missing_tools:
         logger.error("Missing required tools: " + ", ".join(missing_tools))
         logger.info("Install using: pip install " + " ".join(missing_tools))
         return False
     
+    save_probe_cache(TOOLS_CACHE_FILE, key)
     return True
 
 def main():
@@ -240,13 +156,13 @@ def main():
     # Create hooks directory
     create_hooks_directory()
     
-    # Install hooks
-    for hook_name, hook_content in HOOKS.items():
-        install_hook(hook_name, hook_content)
+    # Install hooks; the writes are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=len(HOOK_NAMES)) as executor:
+        list(executor.map(install_hook, HOOK_NAMES, map(render_hook, HOOK_NAMES)))
     
     logger.info("Git hooks setup completed successfully")
     logger.info("\nInstalled hooks:")
-    for hook_name in HOOKS:
+    for hook_name in HOOK_NAMES:
         logger.info(f"- {hook_name}")
 
 if __name__ == "__main__":
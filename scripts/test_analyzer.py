@@ -11,20 +11,17 @@ import argparse
 from pathlib import Path
 import logging
 import json
-from typing import Dict, List, Optional, Set, Union
+import hashlib
+from typing import Dict, List, Optional, Set, TextIO
 import subprocess
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
 import re
 from datetime import datetime
-import pytest
-import coverage
-from pytest_cov.plugin import CovData
-import mutation
-from radon.complexity import cc_visit
-from radon.metrics import mi_visit
+from itertools import groupby
 import ast
-from tqdm import tqdm
-import matplotlib.pyplot as plt
-import seaborn as sns
+import html
 
 # Configure logging
 logging.basicConfig(
@@ -35,21 +32,223 @@ logger = logging.getLogger(__name__)
 
 # Constants
 PROJECT_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT_PREFIX = str(PROJECT_ROOT) + os.sep
 TESTS_DIR = PROJECT_ROOT / "tests"
 REPORTS_DIR = PROJECT_ROOT / "reports" / "tests"
+QUALITY_CACHE_FILE = ".quality_cache.json"
+QUALITY_CACHE_VERSION = 1  # bumped whenever the cached result schema changes
+QUALITY_CACHE_ENTRY_KEYS = frozenset({"mtime_ns", "hash", "result"})
+COVERAGE_CHART_MAX_FILES = 50
+PYTEST_TIMEOUT = 3600  # seconds
+PYTEST_OK_EXIT_CODES = (0, 5)  # all tests passed, or none were collected
+
+# Call and decorator names recognized by the test quality analysis
+MOCK_NAMES = frozenset({"patch", "Mock", "MagicMock"})
+ASSERT_METHOD_PREFIX = "assert_"
+ASSERT_FUNCTION_PREFIX = "assert"
+FIXTURE_DECORATOR = "fixture"
+PARAMETRIZE_DECORATOR = "parametrize"
+
+# Report templates; dynamic strings are HTML-escaped before substitution
+REPORT_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<title>Test Analysis Report</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 20px; }}
+.section {{ margin: 20px 0; padding: 20px; border: 1px solid #ddd; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+th {{ background-color: #f2f2f2; }}
+.chart {{ margin: 20px 0; max-width: 800px; }}
+.good {{ color: #4caf50; }}
+.warning {{ color: #ff9800; }}
+.error {{ color: #f44336; }}
+</style>
+</head>
+<body>
+<h1>Test Analysis Report</h1>
+<p>Generated: {generated}</p>
+"""
+TEST_RESULTS_SECTION = """<div class='section'>
+<h2>Test Results</h2>
+<table>
+<tr><th>Metric</th><th>Value</th></tr>
+<tr><td>Total Tests</td><td>{total}</td></tr>
+<tr><td>Passed</td><td class='good'>{passed}</td></tr>
+<tr><td>Failed</td><td class='error'>{failed}</td></tr>
+<tr><td>Skipped</td><td>{skipped}</td></tr>
+<tr><td>Errors</td><td class='error'>{errors}</td></tr>
+</table>
+"""
+COVERAGE_SECTION = """<h3>Coverage Summary</h3>
+<p>Total Coverage: <span class='{css_class}'>{total:.1f}%</span></p>
+<img src='coverage_chart.png' class='chart'>
+<h4>Missing Coverage</h4>
+<table>
+<tr><th>File</th><th>Missing Lines</th></tr>
+{rows}</table>
+"""
+QUALITY_SECTION = """<div class='section'>
+<h2>Test Quality Analysis</h2>
+<h3>Complexity</h3>
+<table>
+<tr><th>File</th><th>Function</th><th>Complexity</th><th>Rank</th></tr>
+{complexity_rows}</table>
+<h3>Maintainability</h3>
+<table>
+<tr><th>File</th><th>Index</th><th>Rank</th></tr>
+{maintainability_rows}</table>
+<h3>Test Characteristics</h3>
+<ul>
+<li>Total Fixtures: {fixtures}</li>
+<li>Mock Usage: {mocks} instances</li>
+<li>Parameterized Tests: {parameterized}</li>
+</ul>
+"""
+MUTATION_SECTION = """<h3>Mutation Testing</h3>
+<p>Mutation Score: <span class='{css_class}'>{score:.1f}%</span></p>
+<h4>Survived Mutations</h4>
+<table>
+<tr><th>File</th><th>Line</th><th>Operator</th><th>Original</th><th>Mutated</th></tr>
+{rows}</table>
+"""
+MISSING_ROW = "<tr><td>{file}</td><td>{lines}</td></tr>\n"
+COMPLEXITY_ROW = "<tr><td>{file}</td><td>{name}</td><td>{complexity}</td><td>{rank}</td></tr>\n"
+MAINTAINABILITY_ROW = "<tr><td>{file}</td><td>{index:.1f}</td><td>{rank}</td></tr>\n"
+MUTANT_ROW = (
+    "<tr><td>{file}</td><td>{line}</td><td>{operator}</td>"
+    "<td>{original}</td><td>{mutated}</td></tr>\n"
+)
+MUTATION_TARGETS = ["core", "services", "utils"]
+MUTATION_TIMEOUT_SLACK = 10.0  # seconds added to twice the baseline runtime
+MUTATION_SAMPLE_SEED = 42
+DIFF_HUNK_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)", re.MULTILINE)
+DIFF_FILE_RE = re.compile(r"^\+\+\+ b/(.+)$", re.MULTILINE)
+
+# Below this many test files, process pool startup outweighs the parallelism
+PARALLEL_ANALYSIS_MIN_FILES = 8
+
+class TestQualityVisitor(ast.NodeVisitor):
+    """Collect assertion, parametrize, fixture and mock usage in one AST pass."""
+    
+    def __init__(self):
+        """Initialize counters."""
+        self.assertions = 0
+        self.parameterized = 0
+        self.fixtures: Set[str] = set()
+        self.mock_lines: List[int] = []
+    
+    def visit_Call(self, node: ast.Call) -> None:
+        """Count assertion and mock calls."""
+        func = node.func
+        attr = getattr(func, "attr", None)
+        if attr is not None:
+            if attr in MOCK_NAMES:
+                self.mock_lines.append(node.lineno)
+            elif attr.startswith(ASSERT_METHOD_PREFIX):
+                self.assertions += 1
+        else:
+            name = getattr(func, "id", None)
+            if name and name.startswith(ASSERT_FUNCTION_PREFIX):
+                self.assertions += 1
+        self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Classify parametrize and fixture decorators."""
+        for decorator in node.decorator_list:
+            # Only called decorators count, e.g. @pytest.fixture()
+            attr = getattr(getattr(decorator, "func", None), "attr", None)
+            if attr == PARAMETRIZE_DECORATOR:
+                self.parameterized += 1
+            elif attr == FIXTURE_DECORATOR:
+                self.fixtures.add(node.name)
+        self.generic_visit(node)
+
+def _analyze_one(path: str) -> Dict:
+    """Compute quality metrics for a single test file."""
+    from radon.complexity import cc_visit_ast
+    from radon.metrics import mi_visit
+    
+    test_file = Path(path)
+    with open(test_file) as f:
+        content = f.read()
+    
+    # Parse once and share the tree with radon and the visitor
+    tree = ast.parse(content, filename=path)
+    complexity = cc_visit_ast(tree)
+    maintainability = mi_visit(content, True)
+    
+    test_info = {
+        "file": str(test_file.relative_to(PROJECT_ROOT)),
+        "complexity": [],
+        "assertions": 0,
+        "parameterized": 0
+    }
+    
+    visitor = TestQualityVisitor()
+    visitor.visit(tree)
+    
+    test_info["assertions"] = visitor.assertions
+    test_info["parameterized"] = visitor.parameterized
+    
+    # Add complexity metrics
+    for item in complexity:
+        test_info["complexity"].append({
+            "name": item.name,
+            "complexity": item.complexity,
+            "rank": item.rank
+        })
+    
+    return {
+        "test_info": test_info,
+        "maintainability": {
+            "file": test_info["file"],
+            "maintainability_index": maintainability,
+            "rank": "A" if maintainability >= 20 else "B" if maintainability >= 10 else "C"
+        },
+        "fixtures": list(visitor.fixtures),
+        "mocks": [
+            {"file": test_info["file"], "line": line}
+            for line in visitor.mock_lines
+        ]
+    }
+
+def _quality_fingerprint() -> str:
+    """Hash what cached quality results depend on besides file content."""
+    from importlib.metadata import PackageNotFoundError, version
+    
+    try:
+        radon_version = version("radon")
+    except PackageNotFoundError:
+        radon_version = None
+    
+    return hashlib.blake2b(json.dumps([
+        QUALITY_CACHE_VERSION,
+        radon_version,
+        sorted(MOCK_NAMES),
+        ASSERT_METHOD_PREFIX,
+        ASSERT_FUNCTION_PREFIX,
+        FIXTURE_DECORATOR,
+        PARAMETRIZE_DECORATOR
+    ]).encode(), digest_size=16).hexdigest()
 
 class TestAnalyzer:
     """Test analysis utility class."""
     
+    __slots__ = ("tests_dir", "reports_dir", "quality_cache_file")
+    
     def __init__(self):
         """Initialize test analyzer."""
         self.tests_dir = TESTS_DIR
         self.reports_dir = REPORTS_DIR
         
+        self.quality_cache_file = self.reports_dir / QUALITY_CACHE_FILE
+        
         # Create necessary directories
         self.reports_dir.mkdir(parents=True, exist_ok=True)
     
-    def run_tests(self, coverage: bool = True) -> Dict:
+    def run_tests(self, with_coverage: bool = True) -> Dict:
         """Run test suite with coverage."""
         results = {
             "tests": {
@@ -58,40 +257,72 @@ class TestAnalyzer:
                 "failed": 0,
                 "skipped": 0,
                 "errors": 0,
-                "duration": 0.0
+                "duration": 0.0,
+                "exit_code": None
             },
             "coverage": None,
             "failures": []
         }
         
         try:
-            # Configure pytest arguments
-            pytest_args = ["-v"]
-            if coverage:
+            # Configure pytest arguments; pytest-json-report records every
+            # outcome of this run in one file
+            json_report = self.reports_dir / "pytest.json"
+            pytest_args = [
+                "-v",
+                "--json-report",
+                f"--json-report-file={json_report}",
+                "--json-report-omit=log,keywords"
+            ]
+            if with_coverage:
                 pytest_args.extend([
                     "--cov=.",
                     "--cov-report=term-missing",
                     f"--cov-report=html:{self.reports_dir}/coverage"
                 ])
             
-            # Run tests
-            pytest.main(pytest_args)
+            # Run tests in a child process so the test modules, plugins and
+            # their native extensions are freed as soon as it exits; clear the
+            # old report first so a crashed run is not read as this one
+            json_report.unlink(missing_ok=True)
+            try:
+                proc = subprocess.run(
+                    [sys.executable, "-m", "pytest", *pytest_args, "-p", "no:cacheprovider"],
+                    check=False,
+                    timeout=PYTEST_TIMEOUT
+                )
+            except subprocess.TimeoutExpired:
+                logger.error(f"Test run timed out after {PYTEST_TIMEOUT}s")
+                results["tests"]["errors"] += 1
+                return results
+            results["tests"]["exit_code"] = proc.returncode
             
-            # Parse results
-            with open(".pytest_cache/v/cache/lastfailed") as f:
-                failed_tests = json.load(f)
+            # A crashed run, or one that rejected its arguments, leaves no report
+            if not json_report.exists():
+                logger.error(f"pytest exited with code {proc.returncode} without a report")
+                results["tests"]["errors"] += 1
+                return results
             
-            with open(".pytest_cache/v/cache/nodeids") as f:
-                all_tests = json.load(f)
+            # Parse results
+            with open(json_report) as f:
+                report = json.load(f)
             
-            results["tests"]["total"] = len(all_tests)
-            results["tests"]["failed"] = len(failed_tests)
-            results["tests"]["passed"] = (
-                len(all_tests) - len(failed_tests)
-            )
+            summary = report["summary"]
+            results["tests"]["total"] = summary.get("total", 0)
+            results["tests"]["passed"] = summary.get("passed", 0)
+            results["tests"]["failed"] = summary.get("failed", 0)
+            results["tests"]["skipped"] = summary.get("skipped", 0)
+            results["tests"]["errors"] = summary.get("error", 0)
+            results["tests"]["duration"] = report.get("duration", 0.0)
+            results["failures"] = [
+                test["nodeid"]
+                for test in report.get("tests", [])
+                if test["outcome"] in ("failed", "error")
+            ]
             
             # Get coverage data
-            if coverage:
+            if with_coverage:
+                import coverage
                 cov = coverage.Coverage()
                 cov.load()
                 
@@ -102,11 +333,15 @@ class TestAnalyzer:
                 }
                 
                 # Get detailed coverage data
-                for file in cov.get_data().measured_files():
-                    rel_path = Path(file).relative_to(PROJECT_ROOT)
+                data = cov.get_data()
+                for file in data.measured_files():
+                    if file.startswith(PROJECT_ROOT_PREFIX):
+                        rel_path = file[len(PROJECT_ROOT_PREFIX):]
+                    else:
+                        rel_path = os.path.relpath(file, PROJECT_ROOT)
                     analysis = cov.analysis2(file)
                     
-                    results["coverage"]["files"][str(rel_path)] = {
+                    results["coverage"]["files"][rel_path] = {
                         "statements": len(analysis[1]),
                         "missing": len(analysis[2]),
                         "branches": len(analysis[3]),
@@ -114,7 +349,7 @@ class TestAnalyzer:
                     }
                     
                     if analysis[2]:  # Missing lines
-                        results["coverage"]["missing"][str(rel_path)] = list(analysis[2])
+                        results["coverage"]["missing"][rel_path] = list(analysis[2])
             
             return results
             
@@ -134,74 +369,57 @@ class TestAnalyzer:
         }
         
         try:
-            # Analyze test files
+            # Reuse cached results for files whose mtime or content is unchanged
+            fingerprint = _quality_fingerprint()
+            cache = self._load_quality_cache(fingerprint)
+            analyzed = {}
+            stale = []
             for test_file in self.tests_dir.rglob("test_*.py"):
-                with open(test_file) as f:
-                    content = f.read()
+                path = str(test_file)
+                entry = cache.get(path)
+                mtime_ns = test_file.stat().st_mtime_ns
+                if entry and entry["mtime_ns"] == mtime_ns:
+                    analyzed[path] = entry["result"]
+                    continue
                 
-                # Calculate complexity
-                complexity = cc_visit(content)
-                maintainability = mi_visit(content, True)
-                
-                # Parse AST
-                tree = ast.parse(content)
-                
-                test_info = {
-                    "file": str(test_file.relative_to(PROJECT_ROOT)),
-                    "complexity": [],
-                    "assertions": 0,
-                    "parameterized": 0
-                }
-                
-                for node in ast.walk(tree):
-                    # Count assertions
-                    if isinstance(node, ast.Call):
-                        if (hasattr(node.func, 'attr') and
-                            node.func.attr.startswith('assert_')):
-                            test_info["assertions"] += 1
-                        elif isinstance(node.func, ast.Name):
-                            if node.func.id.startswith('assert'):
-                                test_info["assertions"] += 1
-                    
-                    # Check for parameterized tests
-                    if isinstance(node, ast.FunctionDef):
-                        for decorator in node.decorator_list:
-                            if (isinstance(decorator, ast.Call) and
-                                hasattr(decorator.func, 'attr') and
-                                decorator.func.attr == 'parametrize'):
-                                test_info["parameterized"] += 1
-                    
-                    # Collect fixtures
-                    if isinstance(node, ast.FunctionDef):
-                        for decorator in node.decorator_list:
-                            if (isinstance(decorator, ast.Call) and
-                                hasattr(decorator.func, 'attr') and
-                                decorator.func.attr == 'fixture'):
-                                results["fixtures"].add(node.name)
-                    
-                    # Check for mocks
-                    if isinstance(node, ast.Call):
-                        if (hasattr(node.func, 'attr') and
-                            node.func.attr in ['patch', 'Mock', 'MagicMock']):
-                            results["mocks"].append({
-                                "file": test_info["file"],
-                                "line": node.lineno
-                            })
+                digest = hashlib.blake2b(test_file.read_bytes(), digest_size=16).hexdigest()
+                if entry and entry["hash"] == digest:
+                    entry["mtime_ns"] = mtime_ns
+                    analyzed[path] = entry["result"]
+                    continue
                 
-                # Add complexity metrics
-                for item in complexity:
-                    test_info["complexity"].append({
-                        "name": item.name,
-                        "complexity": item.complexity,
-                        "rank": item.rank
-                    })
-                
-                results["complexity"].append(test_info)
-                results["maintainability"].append({
-                    "file": test_info["file"],
-                    "maintainability_index": maintainability,
-                    "rank": "A" if maintainability >= 20 else "B" if maintainability >= 10 else "C"
-                })
+                cache[path] = {"mtime_ns": mtime_ns, "hash": digest, "result": None}
+                analyzed[path] = None
+                stale.append(path)
+            
+            # Analyze the rest; the work per file is independent and
+            # CPU-bound, so spread larger batches across processes
+            if len(stale) > PARALLEL_ANALYSIS_MIN_FILES:
+                from tqdm import tqdm
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    fresh = list(tqdm(
+                        executor.map(_analyze_one, stale, chunksize=4),
+                        total=len(stale),
+                        desc="Analyzing tests"
+                    ))
+            else:
+                fresh = [_analyze_one(path) for path in stale]
+            
+            for path, file_result in zip(stale, fresh):
+                cache[path]["result"] = file_result
+                analyzed[path] = file_result
+            
+            # Drop entries for test files that no longer exist
+            self._save_quality_cache(
+                fingerprint,
+                {path: cache[path] for path in analyzed}
+            )
+            
+            for file_result in analyzed.values():
+                results["complexity"].append(file_result["test_info"])
+                results["maintainability"].append(file_result["maintainability"])
+                results["fixtures"].update(file_result["fixtures"])
+                results["mocks"].extend(file_result["mocks"])
             
             # Convert fixtures to list for JSON serialization
             results["fixtures"] = list(results["fixtures"])
@@ -212,8 +430,44 @@ class TestAnalyzer:
             logger.error(f"Error analyzing test quality: {e}")
             return results
     
-    def run_mutation_testing(self) -> Dict:
+    def _load_quality_cache(self, fingerprint: str) -> Dict[str, Dict]:
+        """Load cached per-file quality results.
+        
+        A cache written under another fingerprint, or with malformed entries,
+        is discarded rather than trusted.
+        """
+        try:
+            cached = json.loads(self.quality_cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+            return {}
+        files = cached.get("files")
+        if not isinstance(files, dict) or not all(
+            isinstance(entry, dict) and entry.keys() == QUALITY_CACHE_ENTRY_KEYS
+            for entry in files.values()
+        ):
+            return {}
+        return files
+    
+    def _save_quality_cache(self, fingerprint: str, cache: Dict[str, Dict]) -> None:
+        """Atomically persist per-file quality results."""
+        tmp_file = self.quality_cache_file.with_suffix(".tmp")
+        try:
+            tmp_file.write_text(json.dumps({"fingerprint": fingerprint, "files": cache}))
+            os.replace(tmp_file, self.quality_cache_file)
+        except OSError as e:
+            logger.warning(f"Error saving quality cache: {e}")
+    
+    def run_mutation_testing(
+        self,
+        base_runtime: Optional[float] = None,
+        sample_rate: float = 1.0
+    ) -> Dict:
         """Run mutation testing on the test suite."""
+        import mutation
+        
         results = {
             "score": 0.0,
             "mutations": [],
@@ -222,10 +476,36 @@ class TestAnalyzer:
         }
         
         try:
-            # Configure mutation testing
+            # Time an unmutated run if the caller has no duration to share;
+            # it bounds how long a mutant may run before counting as killed
+            if base_runtime is None:
+                start = time.perf_counter()
+                subprocess.run(
+                    [sys.executable, "-m", "pytest", "-q", "--no-header"],
+                    cwd=PROJECT_ROOT,
+                    capture_output=True
+                )
+                base_runtime = time.perf_counter() - start
+            
+            # Snapshot the working tree so the runner diffs mutants against it
+            # rather than HEAD, which would blame uncommitted edits on them
+            base_rev = subprocess.run(
+                ["git", "stash", "create"],
+                cwd=PROJECT_ROOT,
+                capture_output=True,
+                text=True
+            ).stdout.strip() or "HEAD"
+            
+            # Configure mutation testing; each mutant is checked by the
+            # two-phase runner in this script instead of the full suite
             config = {
-                "targets": ["core", "services", "utils"],
-                "unit_test_command": "pytest",
+                "targets": MUTATION_TARGETS,
+                "unit_test_command": (
+                    f'"{sys.executable}" "{Path(__file__).resolve()}" --mutant-test-runner'
+                    f" --mutation-base {base_rev}"
+                    f" --mutation-base-runtime {base_runtime}"
+                    f" --mutation-sample {sample_rate}"
+                ),
                 "test_dir": "tests",
                 "exclude": ["__init__.py"]
             }
@@ -239,9 +519,21 @@ class TestAnalyzer:
                 with open(results_file) as f:
                     mutation_results = json.load(f)
                 
-                results["score"] = mutation_results["mutation_score"]
+                mutants = mutation_results["mutants"]
+                if sample_rate < 1.0:
+                    # Only sampled mutants were actually tested
+                    sampled = [
+                        mutant for mutant in mutants
+                        if _mutant_sampled(_project_path(mutant["file"]), mutant["line"], sample_rate)
+                    ]
+                    logger.info(f"Sampled {len(sampled)} of {len(mutants)} mutants")
+                    mutants = sampled
+                    killed = sum(mutant["status"] != "survived" for mutant in mutants)
+                    results["score"] = killed / len(mutants) * 100 if mutants else 0.0
+                else:
+                    results["score"] = mutation_results["mutation_score"]
                 
-                for mutant in mutation_results["mutants"]:
+                for mutant in mutants:
                     mutant_info = {
                         "file": mutant["file"],
                         "line": mutant["line"],
@@ -273,152 +565,124 @@ class TestAnalyzer:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = self.reports_dir / f"test_report_{timestamp}.html"
         
-        content = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            "<title>Test Analysis Report</title>",
-            "<style>",
-            "body { font-family: Arial, sans-serif; margin: 20px; }",
-            ".section { margin: 20px 0; padding: 20px; border: 1px solid #ddd; }",
-            "table { border-collapse: collapse; width: 100%; }",
-            "th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }",
-            "th { background-color: #f2f2f2; }",
-            ".chart { margin: 20px 0; max-width: 800px; }",
-            ".good { color: #4caf50; }",
-            ".warning { color: #ff9800; }",
-            ".error { color: #f44336; }",
-            "</style>",
-            "</head>",
-            "<body>",
-            "<h1>Test Analysis Report</h1>",
-            f"<p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>"
-        ]
+        # Stream each section to a temporary file rather than building the
+        # whole page, then move it into place so readers never see a partial report
+        tmp_file = report_file.with_suffix(".html.tmp")
+        with tmp_file.open("w", buffering=1 << 20) as w:
+            self._write_header(w)
+            self._write_test_results(w, test_results)
+            self._write_quality(w, quality_results)
+            if mutation_results:
+                self._write_mutation(w, mutation_results)
+            w.write("</div>\n</body>\n</html>")
+        os.replace(tmp_file, report_file)
         
-        # Test results section
-        content.extend([
-            "<div class='section'>",
-            "<h2>Test Results</h2>",
-            "<table>",
-            "<tr><th>Metric</th><th>Value</th></tr>",
-            f"<tr><td>Total Tests</td><td>{test_results['tests']['total']}</td></tr>",
-            f"<tr><td>Passed</td><td class='good'>{test_results['tests']['passed']}</td></tr>",
-            f"<tr><td>Failed</td><td class='error'>{test_results['tests']['failed']}</td></tr>",
-            f"<tr><td>Skipped</td><td>{test_results['tests']['skipped']}</td></tr>",
-            f"<tr><td>Errors</td><td class='error'>{test_results['tests']['errors']}</td></tr>",
-            "</table>"
-        ])
+        return report_file
+    
+    def _write_header(self, w: TextIO) -> None:
+        """Write the document head and title."""
+        w.write(REPORT_HTML_HEAD.format(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ))
+    
+    def _write_test_results(self, w: TextIO, test_results: Dict) -> None:
+        """Write the test results and coverage section."""
+        w.write(TEST_RESULTS_SECTION.format(**test_results["tests"]))
         
         if test_results.get("coverage"):
-            # Create coverage chart
-            plt.figure(figsize=(10, 6))
-            coverage_data = [
-                (file, data["statements"] - data["missing"])
-                for file, data in test_results["coverage"]["files"].items()
-            ]
-            files, coverage = zip(*coverage_data)
+            import matplotlib
+            matplotlib.use("Agg")
+            from matplotlib.figure import Figure
+            import numpy as np
             
-            plt.bar(range(len(files)), coverage)
-            plt.xticks(range(len(files)), files, rotation=45, ha="right")
-            plt.title("Coverage by File")
-            plt.ylabel("Covered Statements")
-            plt.tight_layout()
-            plt.savefig(self.reports_dir / "coverage_chart.png")
-            plt.close()
+            # Gather per-file counts into arrays and chart only the files with
+            # the most missing statements
+            file_data = test_results["coverage"]["files"]
+            files = np.array(list(file_data), dtype=object)
+            statements = np.fromiter(
+                (data["statements"] for data in file_data.values()),
+                dtype=np.int32,
+                count=len(file_data)
+            )
+            missing = np.fromiter(
+                (data["missing"] for data in file_data.values()),
+                dtype=np.int32,
+                count=len(file_data)
+            )
+            worst = np.argsort(-missing, kind="stable")[:COVERAGE_CHART_MAX_FILES]
             
-            content.extend([
-                "<h3>Coverage Summary</h3>",
-                f"<p>Total Coverage: <span class='{self._get_coverage_class(test_results['coverage']['total'])}'>"
-                f"{test_results['coverage']['total']:.1f}%</span></p>",
-                "<img src='coverage_chart.png' class='chart'>",
-                "<h4>Missing Coverage</h4>",
-                "<table>",
-                "<tr><th>File</th><th>Missing Lines</th></tr>"
-            ])
+            # Create coverage chart on a standalone Agg figure, bypassing pyplot
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
+            positions = np.arange(len(worst))
+            ax.bar(positions, statements[worst] - missing[worst])
+            ax.set_xticks(positions)
+            ax.set_xticklabels(files[worst], rotation=45, ha="right")
+            ax.set_title("Coverage by File")
+            ax.set_ylabel("Covered Statements")
+            fig.tight_layout()
+            fig.savefig(self.reports_dir / "coverage_chart.png", dpi=90)
             
-            for file, lines in test_results["coverage"]["missing"].items():
-                content.append(
-                    f"<tr><td>{file}</td><td>{', '.join(map(str, lines))}</td></tr>"
+            total = test_results["coverage"]["total"]
+            w.write(COVERAGE_SECTION.format(
+                css_class=self._get_coverage_class(total),
+                total=total,
+                rows="".join(
+                    MISSING_ROW.format(
+                        file=html.escape(file),
+                        lines=_format_lines_compact(lines)
+                    )
+                    for file, lines in test_results["coverage"]["missing"].items()
                 )
-            
-            content.append("</table>")
+            ))
         
-        content.append("</div>")
-        
-        # Test quality section
-        content.extend([
-            "<div class='section'>",
-            "<h2>Test Quality Analysis</h2>",
-            "<h3>Complexity</h3>",
-            "<table>",
-            "<tr><th>File</th><th>Function</th><th>Complexity</th><th>Rank</th></tr>"
-        ])
-        
-        for test_file in quality_results["complexity"]:
-            for func in test_file["complexity"]:
-                content.append(
-                    f"<tr><td>{test_file['file']}</td><td>{func['name']}</td>"
-                    f"<td>{func['complexity']}</td><td>{func['rank']}</td></tr>"
+        w.write("</div>\n")
+    
+    def _write_quality(self, w: TextIO, quality_results: Dict) -> None:
+        """Write the test quality section."""
+        w.write(QUALITY_SECTION.format(
+            complexity_rows="".join(
+                COMPLEXITY_ROW.format(
+                    file=html.escape(test_file["file"]),
+                    name=html.escape(func["name"]),
+                    complexity=func["complexity"],
+                    rank=func["rank"]
                 )
-        
-        content.extend([
-            "</table>",
-            "<h3>Maintainability</h3>",
-            "<table>",
-            "<tr><th>File</th><th>Index</th><th>Rank</th></tr>"
-        ])
-        
-        for item in quality_results["maintainability"]:
-            content.append(
-                f"<tr><td>{item['file']}</td>"
-                f"<td>{item['maintainability_index']:.1f}</td>"
-                f"<td>{item['rank']}</td></tr>"
+                for test_file in quality_results["complexity"]
+                for func in test_file["complexity"]
+            ),
+            maintainability_rows="".join(
+                MAINTAINABILITY_ROW.format(
+                    file=html.escape(item["file"]),
+                    index=item["maintainability_index"],
+                    rank=item["rank"]
+                )
+                for item in quality_results["maintainability"]
+            ),
+            fixtures=len(quality_results["fixtures"]),
+            mocks=len(quality_results["mocks"]),
+            parameterized=sum(
+                test["parameterized"]
+                for test in quality_results["complexity"]
             )
-        
-        content.extend([
-            "</table>",
-            "<h3>Test Characteristics</h3>",
-            "<ul>",
-            f"<li>Total Fixtures: {len(quality_results['fixtures'])}</li>",
-            f"<li>Mock Usage: {len(quality_results['mocks'])} instances</li>"
-        ])
-        
-        parameterized_count = sum(
-            test["parameterized"]
-            for test in quality_results["complexity"]
-        )
-        content.append(f"<li>Parameterized Tests: {parameterized_count}</li>")
-        
-        content.append("</ul>")
-        
-        # Mutation testing section
-        if mutation_results:
-            content.extend([
-                "<h3>Mutation Testing</h3>",
-                f"<p>Mutation Score: <span class='{self._get_mutation_class(mutation_results['score'])}'>"
-                f"{mutation_results['score']:.1f}%</span></p>",
-                "<h4>Survived Mutations</h4>",
-                "<table>",
-                "<tr><th>File</th><th>Line</th><th>Operator</th><th>Original</th><th>Mutated</th></tr>"
-            ])
-            
-            for mutant in mutation_results["survived"]:
-                content.append(
-                    f"<tr><td>{mutant['file']}</td><td>{mutant['line']}</td>"
-                    f"<td>{mutant['operator']}</td><td>{mutant['original']}</td>"
-                    f"<td>{mutant['mutated']}</td></tr>"
+        ))
+    
+    def _write_mutation(self, w: TextIO, mutation_results: Dict) -> None:
+        """Write the mutation testing section."""
+        w.write(MUTATION_SECTION.format(
+            css_class=self._get_mutation_class(mutation_results["score"]),
+            score=mutation_results["score"],
+            rows="".join(
+                MUTANT_ROW.format(
+                    file=html.escape(str(mutant["file"])),
+                    line=mutant["line"],
+                    operator=html.escape(str(mutant["operator"])),
+                    original=html.escape(str(mutant["original"])),
+                    mutated=html.escape(str(mutant["mutated"]))
                 )
-            
-            content.append("</table>")
-        
-        content.extend([
-            "</div>",
-            "</body>",
-            "</html>"
-        ])
-        
-        report_file.write_text("\n".join(content))
-        return report_file
+                for mutant in mutation_results["survived"]
+            )
+        ))
     
     def _get_coverage_class(self, coverage: float) -> str:
         """Get CSS class for coverage percentage."""
@@ -438,6 +702,75 @@ class TestAnalyzer:
         else:
             return "error"
 
+def _tests_for_module(path: str) -> List[str]:
+    """Find the test files named after a source module."""
+    return sorted(
+        str(test_file.relative_to(PROJECT_ROOT))
+        for test_file in TESTS_DIR.rglob(f"test_{Path(path).stem}.py")
+    )
+
+def _format_lines_compact(lines: List[int]) -> str:
+    """Format line numbers as ranges, e.g. "12-18, 42, 55-60"."""
+    runs = []
+    for _, group in groupby(enumerate(sorted(lines)), key=lambda t: t[1] - t[0]):
+        run = [line for _, line in group]
+        runs.append(f"{run[0]}-{run[-1]}" if len(run) > 1 else str(run[0]))
+    return ", ".join(runs)
+
+def _project_path(path: str) -> str:
+    """Normalize a path to be relative to the project root."""
+    return os.path.relpath(os.path.abspath(path), PROJECT_ROOT)
+
+def _mutant_sampled(path: str, line: int, sample_rate: float) -> bool:
+    """Decide reproducibly whether mutants on a source line are tested."""
+    return random.Random(f"{MUTATION_SAMPLE_SEED}:{path}:{line}").random() < sample_rate
+
+def run_mutant_tests(base_rev: str, base_runtime: float, sample_rate: float) -> int:
+    """Test the current mutant, running the mutated module's tests first.
+    
+    The mutation tool rewrites sources in place, so the mutated module is
+    whatever git reports as modified under the mutation targets since
+    base_rev, the working tree snapshot taken before mutating. Returns a
+    non-zero exit status when the mutant is killed.
+    """
+    diff = subprocess.run(
+        ["git", "diff", "-U0", base_rev, "--", *MUTATION_TARGETS],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    ).stdout
+    changed = DIFF_FILE_RE.findall(diff)
+    
+    # Mutants outside the sample are reported killed without running anything
+    # and left out of the score afterwards
+    hunk = DIFF_HUNK_RE.search(diff)
+    if (
+        sample_rate < 1.0
+        and changed
+        and hunk
+        and not _mutant_sampled(changed[0], int(hunk.group(1)), sample_rate)
+    ):
+        return 1
+    
+    focused = [test for path in changed for test in _tests_for_module(path)]
+    
+    timeout = base_runtime * 2 + MUTATION_TIMEOUT_SLACK
+    pytest_cmd = [sys.executable, "-m", "pytest", "-x", "-q", "--no-header"]
+    
+    # Phase 1 runs only the focused tests; phase 2 runs everything else and
+    # is needed only when the mutant survives phase 1. A phase with no tests
+    # left to collect (exit 5) does not kill the mutant.
+    phases = [focused] if focused else []
+    phases.append([f"--deselect={test}" for test in focused])
+    for phase_args in phases:
+        try:
+            result = subprocess.run([*pytest_cmd, *phase_args], cwd=PROJECT_ROOT, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return 1
+        if result.returncode not in PYTEST_OK_EXIT_CODES:
+            return result.returncode
+    return 0
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -462,11 +795,49 @@ def parse_args() -> argparse.Namespace:
         help="Output in JSON format"
     )
     
+    parser.add_argument(
+        "--mutation-sample",
+        type=float,
+        default=1.0,
+        help="Fraction of mutated source lines to test (0-1]"
+    )
+    
+    # Invoked by the mutation tool for each mutant
+    parser.add_argument(
+        "--mutant-test-runner",
+        action="store_true",
+        help=argparse.SUPPRESS
+    )
+    
+    parser.add_argument(
+        "--mutation-base",
+        default="HEAD",
+        help=argparse.SUPPRESS
+    )
+    
+    parser.add_argument(
+        "--mutation-base-runtime",
+        type=float,
+        default=60.0,
+        help=argparse.SUPPRESS
+    )
+    
     return parser.parse_args()
 
 def main():
     """Main function."""
     args = parse_args()
+    if not 0.0 < args.mutation_sample <= 1.0:
+        logger.error("--mutation-sample must be in (0, 1]")
+        sys.exit(2)
+    
+    if args.mutant_test_runner:
+        sys.exit(run_mutant_tests(
+            args.mutation_base,
+            args.mutation_base_runtime,
+            args.mutation_sample
+        ))
+    
     analyzer = TestAnalyzer()
     
     try:
@@ -476,7 +847,10 @@ def main():
         mutation_results = None
         
         if args.mutation:
-            mutation_results = analyzer.run_mutation_testing()
+            mutation_results = analyzer.run_mutation_testing(
+                test_results["tests"]["duration"] or None,
+                args.mutation_sample
+            )
         
         if args.json:
             results = {
@@ -494,8 +868,13 @@ def main():
             )
             logger.info(f"Report generated: {report_file}")
         
-        # Exit with error if tests failed
-        if test_results["tests"]["failed"] > 0:
+        # Exit with error if tests failed or pytest did not run to completion
+        tests = test_results["tests"]
+        if (
+            tests["failed"] > 0
+            or tests["errors"] > 0
+            or tests["exit_code"] not in PYTEST_OK_EXIT_CODES
+        ):
             sys.exit(1)
         
     except KeyboardInterrupt:
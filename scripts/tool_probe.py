@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tool probing helpers for Jarvis AI Assistant setup scripts.
+This module checks that command-line tools run and caches a passing result,
+keyed by PATH and each tool's location and mtime, so later runs can skip
+the probes.
+"""
+
+import os
+from pathlib import Path
+import logging
+import json
+import shutil
+import hashlib
+import time
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+def probe_cache_key(tools: List[str]) -> str:
+    """Hash PATH and the location and mtime of each tool."""
+    parts = [os.environ.get("PATH", "")]
+    for tool in tools:
+        path = shutil.which(tool)
+        if path:
+            parts.append(f"{path}:{os.path.getmtime(path)}")
+    return hashlib.blake2b("|".join(parts).encode()).hexdigest()
+
+def probe(tool: str) -> bool:
+    """Check whether a tool runs with --version."""
+    try:
+        subprocess.run(
+            [tool, "--version"],
+            check=True,
+            capture_output=True
+        )
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+def probe_all(tools: List[str]) -> List[bool]:
+    """Probe all tools concurrently, keeping the listed order."""
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        return list(executor.map(probe, tools))
+
+def probe_cache_hit(cache_file: Path, key: str) -> bool:
+    """Check whether the same tools passed on a previous run."""
+    try:
+        cache = json.loads(cache_file.read_text())
+        return cache.get("key") == key and bool(cache.get("ok"))
+    except (OSError, ValueError):
+        return False
+
+def save_probe_cache(cache_file: Path, key: str) -> None:
+    """Record that the tools behind key passed their probes."""
+    try:
+        cache_file.write_text(json.dumps({
+            "key": key,
+            "ok": True,
+            "timestamp": time.time()
+        }))
+    except OSError as e:
+        logger.warning(f"Could not save tools cache: {e}")
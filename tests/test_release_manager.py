@@ -0,0 +1,20 @@
+"""Tests for the release manager's changelog categorization."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from release_manager import _fallback_category
+
+
+@pytest.mark.parametrize("message, category", [
+    ("Remove deprecated API", "Deprecated"),
+    ("Security: remove old token", "Removed"),
+    ("Harden security of the login flow", "Security"),
+    ("Tweak the settings dialog", "Changed"),
+])
+def test_fallback_category_uses_keyword_priority(message, category):
+    assert _fallback_category(message) == category